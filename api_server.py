@@ -1,25 +1,35 @@
 """FastAPI backend that wraps the mcp_adapter pipeline for the frontend.
 
-Run:  uvicorn api_server:app --port 8080 --reload --reload-exclude output
+Run:  uvicorn api_server:app --loop uvloop --http httptools --port 8080
+Dev:  uvicorn api_server:app --port 8080 --reload --reload-exclude output
 """
 
 from __future__ import annotations
 
+import asyncio
+import copy
 import json
 import os
-import pickle
+import re
+import secrets
 import tempfile
-import uuid
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import asdict
 from pathlib import Path
 from typing import Any
 
+import orjson
+
 from dotenv import load_dotenv
 
 load_dotenv()
 
-from fastapi import FastAPI, File, Form, HTTPException, UploadFile
+from fastapi import FastAPI, File, Form, HTTPException, Request, Response, UploadFile
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from pydantic import BaseModel, TypeAdapter
 
 from mcp_adapter.ingest import ingest
 from mcp_adapter.mine import mine_tools
@@ -28,7 +38,7 @@ from mcp_adapter.models import (
     ParamSchema, SafetyLevel, ToolDefinition, ToolParam,
 )
 from mcp_adapter.safety import SafetyPolicy, apply_safety
-from mcp_adapter.agentic_codegen import generate as agentic_generate
+from mcp_adapter.agentic_codegen import GeneratedOutput, generate as agentic_generate
 from mcp_adapter.deploy import deploy as deploy_to_github
 from mcp_adapter.swagger_ingest import ingest as swagger_ingest
 from mcp_adapter.sdk_ingest import ingest as sdk_ingest
@@ -37,13 +47,46 @@ from mcp_adapter.logger import setup_logging
 
 setup_logging(verbose=False)
 
-app = FastAPI(title="MCP Maker API")
+app = FastAPI(title="MCP Maker API", default_response_class=ORJSONResponse)
+
+
+@app.on_event("startup")
+async def _raise_threadpool_limit() -> None:
+    """Give the blocking offloads real headroom.
+
+    Pipeline stages go through asyncio.to_thread, which uses the event
+    loop's default executor (capped at min(32, cpu+4) out of the box) —
+    install a 64-worker one. Starlette's own offloads (UploadFile reads)
+    run on the anyio pool instead, so its limiter gets the same bump.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    from anyio import to_thread
+
+    asyncio.get_running_loop().set_default_executor(
+        ThreadPoolExecutor(max_workers=64, thread_name_prefix="pipeline")
+    )
+    to_thread.current_default_thread_limiter().total_tokens = 64
+
+
+@app.on_event("startup")
+async def _sweep_stale_sessions() -> None:
+    """Evict session files past their TTL so .sessions/ doesn't grow forever."""
+    asyncio.get_running_loop().run_in_executor(None, _evict_expired_sessions)
+
+
+
+# Concrete origins (comma-separated ALLOWED_ORIGINS) keep Starlette on the
+# static-ACAO fast path; wildcard + credentials would force per-request origin
+# echoing, so credentials are only allowed with an explicit origin list.
+_ALLOWED_ORIGINS = [o.strip() for o in os.getenv("ALLOWED_ORIGINS", "").split(",") if o.strip()]
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
+    allow_origins=_ALLOWED_ORIGINS or ["*"],
+    allow_credentials=bool(_ALLOWED_ORIGINS),
     allow_methods=["*"],
     allow_headers=["*"],
+    max_age=86400,
 )
 
 # ── File-backed session store (survives uvicorn reloads) ──────────────────
@@ -52,6 +95,40 @@ _SESSION_DIR = Path(__file__).parent / ".sessions"
 _SESSION_DIR.mkdir(exist_ok=True)
 OUTPUT_ROOT = Path(__file__).parent / "output"
 
+# In-process LRU cache over decoded sessions: session_id → (mtime_ns, data).
+# A wizard flow hits the same session several times per minute; serving from
+# memory skips the disk read + model revival. mtime_ns guards against another
+# worker (or a --reload restart) having rewritten the file underneath us.
+_SESSION_CACHE: OrderedDict[str, tuple[int, dict[str, Any]]] = OrderedDict()
+_SESSION_CACHE_MAX = 256
+_SESSION_CACHE_LOCK = threading.Lock()
+
+# Sessions are ephemeral wizard state; anything untouched this long is dead
+_SESSION_TTL_SECONDS = 86400
+
+
+def _evict_expired_sessions() -> None:
+    """Delete session files whose mtime is older than the TTL.
+
+    Runs once at startup on a worker thread; a wizard flow touches its
+    file on every mutation, so live sessions are never swept.
+    """
+    import time
+
+    cutoff = time.time() - _SESSION_TTL_SECONDS
+    swept = 0
+    for entry in os.scandir(_SESSION_DIR):
+        try:
+            if entry.name.endswith(".json") and entry.stat().st_mtime < cutoff:
+                os.unlink(entry.path)
+                swept += 1
+        except OSError:
+            continue
+    if swept:
+        from mcp_adapter.logger import get_logger
+
+        get_logger().info("Swept %d expired session file(s)", swept)
+
 # ── Credit store (JSON file per user) ─────────────────────────────────────
 
 _CREDITS_DIR = Path(__file__).parent / ".credits"
@@ -60,6 +137,28 @@ CREDIT_COST_PER_TOOL = 1  # credits charged per tool generated
 CREDIT_PACK_SIZE = 100    # credits per purchase
 CREDIT_PACK_PRICE = 1000  # $10.00 in cents
 
+# Ingest results by (source_type, source, mtime): re-submitting the same spec
+# URL/path — common while iterating in the UI — skips the fetch/parse/mine
+# pipeline entirely. Entries are isolated deep copies because sessions mutate
+# their spec/tools in place (policy updates, discovery filtering). URL sources
+# carry no mtime, so their entries expire after a TTL instead of living for
+# the whole server process while the remote spec moves on.
+_INGEST_CACHE: OrderedDict[tuple, tuple[float, tuple]] = OrderedDict()
+_INGEST_CACHE_MAX = 32
+_INGEST_CACHE_URL_TTL = 300.0  # seconds
+_INGEST_CACHE_LOCK = threading.Lock()
+
+# Matches `def test_*(` / `async def test_*(` in generated test files
+_TEST_DEF_RE = re.compile(r"^[ \t]*(?:async\s+)?def\s+(test_\w+)\s*\(", re.MULTILINE)
+
+# One Rust-backed serializer for the auth-scheme list, built once at import —
+# cheaper than per-scheme model_dump() calls inside the payload builder
+_AUTH_SCHEMES_ADAPTER = TypeAdapter(list[AuthScheme])
+
+# Generated-output files worth returning inline from /api/generate
+_TEXT_EXTS = frozenset({".py", ".json", ".toml", ".txt", ".env", ".md", ".yaml", ".yml"})
+_MAX_INLINE_FILE_BYTES = 1_000_000
+
 
 def _get_credits(user: str) -> dict:
     """Load credit balance for a user."""
@@ -74,17 +173,137 @@ def _save_credits(user: str, data: dict) -> None:
     (_CREDITS_DIR / f"{user}.json").write_text(json.dumps(data, indent=2))
 
 
+def _session_to_jsonable(data: dict[str, Any]) -> dict[str, Any]:
+    """Convert a session dict (Pydantic models + dataclasses) to plain JSON types."""
+    out = dict(data)
+    spec = out.get("spec")
+    if isinstance(spec, APISpec):
+        out["spec"] = spec.model_dump(mode="json")
+    out["tools"] = [
+        t.model_dump(mode="json") if isinstance(t, ToolDefinition) else t
+        for t in out.get("tools", [])
+    ]
+    gen = out.get("generated")
+    if isinstance(gen, GeneratedOutput):
+        gen_dict = asdict(gen)
+        gen_dict["output_dir"] = str(gen.output_dir) if gen.output_dir else None
+        out["generated"] = gen_dict
+    return out
+
+
+def _session_from_jsonable(raw: dict[str, Any]) -> dict[str, Any]:
+    """Revive canonical models from a JSON session dict."""
+    data = dict(raw)
+    if data.get("spec") is not None:
+        data["spec"] = APISpec.model_validate(data["spec"])
+    data["tools"] = [ToolDefinition.model_validate(t) for t in data.get("tools", [])]
+    gen = data.get("generated")
+    if gen is not None:
+        gen = dict(gen)
+        if gen.get("output_dir"):
+            gen["output_dir"] = Path(gen["output_dir"])
+        data["generated"] = GeneratedOutput(**gen)
+    return data
+
+
+def _cache_session(session_id: str, mtime_ns: int, data: dict[str, Any]) -> None:
+    """Insert/refresh a cache entry, evicting the least recently used one."""
+    with _SESSION_CACHE_LOCK:
+        _SESSION_CACHE[session_id] = (mtime_ns, data)
+        _SESSION_CACHE.move_to_end(session_id)
+        while len(_SESSION_CACHE) > _SESSION_CACHE_MAX:
+            _SESSION_CACHE.popitem(last=False)
+
+
+def _build_session_payload(session_id: str, sess: dict[str, Any]) -> dict[str, Any]:
+    """Build the serialized spec/tools/endpoints response for a session.
+
+    Computed once per mutation (in _save_session) so GET /api/session is a
+    plain dict passthrough instead of re-walking every tool and endpoint.
+    """
+    api_spec = sess["spec"]
+    return {
+        "session_id": session_id,
+        "spec": {
+            "title": api_spec.title,
+            "version": api_spec.version,
+            "description": api_spec.description,
+            "base_url": api_spec.base_url,
+            "tags": api_spec.tags,
+            "auth_schemes": _AUTH_SCHEMES_ADAPTER.dump_python(api_spec.auth_schemes, mode="json"),
+        },
+        "endpoints": _serialize_endpoints(api_spec.endpoints),
+        "tools": _serialize_tools(sess["tools"]),
+        "classifications": sess.get("classifications", {}),
+        "has_generated": sess.get("generated") is not None,
+    }
+
+
 def _save_session(session_id: str, data: dict[str, Any]) -> None:
-    """Persist session to disk."""
-    (_SESSION_DIR / f"{session_id}.pkl").write_bytes(pickle.dumps(data))
+    """Persist session to disk (atomic orjson write) and refresh the cache.
+
+    Handlers that mutate spec/tools/classifications pop "payload" before
+    saving; it is rebuilt here only when missing.
+    """
+    if "payload" not in data:
+        data["payload"] = _build_session_payload(session_id, data)
+    path = _SESSION_DIR / f"{session_id}.json"
+    tmp_path = path.with_name(f"{session_id}.json.tmp")
+    tmp_path.write_bytes(orjson.dumps(_session_to_jsonable(data)))
+    os.replace(tmp_path, path)
+    _cache_session(session_id, path.stat().st_mtime_ns, data)
 
 
 def _load_session(session_id: str) -> dict[str, Any] | None:
-    """Load session from disk."""
-    p = _SESSION_DIR / f"{session_id}.pkl"
-    if p.exists():
-        return pickle.loads(p.read_bytes())
-    return None
+    """Load session from the in-process cache, falling back to disk."""
+    p = _SESSION_DIR / f"{session_id}.json"
+    try:
+        mtime_ns = p.stat().st_mtime_ns
+    except FileNotFoundError:
+        with _SESSION_CACHE_LOCK:
+            _SESSION_CACHE.pop(session_id, None)
+        return None
+
+    with _SESSION_CACHE_LOCK:
+        cached = _SESSION_CACHE.get(session_id)
+        if cached and cached[0] == mtime_ns:
+            _SESSION_CACHE.move_to_end(session_id)
+            return cached[1]
+
+    data = _session_from_jsonable(orjson.loads(p.read_bytes()))
+    _cache_session(session_id, mtime_ns, data)
+    return data
+
+
+class SessionContext:
+    """Load a session once, write it back once on clean exit if marked dirty.
+
+    Mutation handlers set ``ctx.dirty = True`` after changing ``ctx.data``;
+    the stale precomputed payload is dropped automatically before saving.
+    """
+
+    def __init__(self, session_id: str):
+        self.session_id = session_id
+        self.data: dict[str, Any] | None = None
+        self.dirty = False
+
+    async def __aenter__(self) -> "SessionContext":
+        self.data = await asyncio.to_thread(_load_session, self.session_id)
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        if exc_type is not None:
+            # The cache hands out the same dict to every caller, and the
+            # handler may have half-mutated it before raising. The save is
+            # skipped, so drop the entry too — otherwise later requests
+            # would serve state that diverges from disk until restart.
+            if self.data is not None:
+                with _SESSION_CACHE_LOCK:
+                    _SESSION_CACHE.pop(self.session_id, None)
+            return
+        if self.dirty and self.data is not None:
+            self.data.pop("payload", None)
+            await asyncio.to_thread(_save_session, self.session_id, self.data)
 
 
 # ── Request / response models ─────────────────────────────────────────────
@@ -120,12 +339,94 @@ class CreditPurchaseRequest(BaseModel):
     payment_id: str | None = None  # Flowglad payment/checkout ID
 
 
+def _stream_payload(payload: dict[str, Any], extra: dict[str, Any]):
+    """Yield the ingest payload as JSON encoded one element at a time.
+
+    For specs with hundreds of endpoints this overlaps encoding with
+    transmission instead of buffering one big dump; the bytes still form
+    the exact dict shape clients already parse. Sync generator on
+    purpose — Starlette iterates it on the threadpool.
+    """
+    head = {k: v for k, v in payload.items() if k not in ("endpoints", "tools")}
+    head.update(extra)
+    yield orjson.dumps(head)[:-1] + b',"endpoints":['
+    for i, ep in enumerate(payload["endpoints"]):
+        yield (b"," if i else b"") + orjson.dumps(ep)
+    yield b'],"tools":['
+    for i, t in enumerate(payload["tools"]):
+        yield (b"," if i else b"") + orjson.dumps(t)
+    yield b"]}"
+
+
+def _ingest_cache_key(source: str, source_type: str) -> tuple:
+    """Cache key for an ingest source; local files are keyed on mtime so
+    edits invalidate naturally. URLs and other non-path sources get an
+    mtime of 0 and rely on the TTL check in _ingest_cache_get instead.
+    """
+    try:
+        st = os.stat(source)
+    except (OSError, ValueError):
+        return (source_type, source, 0)  # URL or other non-path source
+    return (source_type, source, st.st_mtime_ns)
+
+
+def _ingest_cache_get(key: tuple) -> tuple | None:
+    with _INGEST_CACHE_LOCK:
+        row = _INGEST_CACHE.get(key)
+        if row is not None:
+            created, entry = row
+            # mtime-keyed entries self-invalidate on edit; mtime-0 (URL)
+            # entries have no such signal, so they age out on the TTL
+            if key[2] == 0 and time.monotonic() - created > _INGEST_CACHE_URL_TTL:
+                del _INGEST_CACHE[key]
+                row = None
+            else:
+                _INGEST_CACHE.move_to_end(key)
+    # Copy outside the lock — sessions mutate these objects in place
+    return copy.deepcopy(row[1]) if row is not None else None
+
+
+def _ingest_cache_put(key: tuple, entry: tuple) -> None:
+    snapshot = copy.deepcopy(entry)
+    with _INGEST_CACHE_LOCK:
+        _INGEST_CACHE[key] = (time.monotonic(), snapshot)
+        _INGEST_CACHE.move_to_end(key)
+        while len(_INGEST_CACHE) > _INGEST_CACHE_MAX:
+            _INGEST_CACHE.popitem(last=False)
+
+
 # ── Raw tool → canonical model converters ─────────────────────────────────
 
+def _tools_to_raw(tools: list[ToolDefinition]) -> list[dict]:
+    """Rebuild raw tool dicts (the discover-step input) from canonical tools.
+
+    Binds the first endpoint once per tool instead of re-indexing
+    t.endpoints[0] for each field.
+    """
+    raw: list[dict] = []
+    for t in tools:
+        ep = t.endpoints[0] if t.endpoints else None
+        raw.append({
+            "name": t.name,
+            "description": t.description,
+            "method": ep.method.value if ep else "GET",
+            "path": ep.path if ep else "/",
+            "params": [
+                {"name": p.name, "type": p.json_type, "required": p.required,
+                 "location": "body", "description": p.description}
+                for p in t.params
+            ],
+            "tags": t.tags,
+        })
+    return raw
+
+
+
 def _raw_tools_to_canonical(raw_tools: list[dict], api_info: dict) -> tuple[APISpec, list[ToolDefinition]]:
     """Convert raw tool dicts (from swagger_ingest/sdk_ingest) into canonical APISpec + ToolDefinition."""
     endpoints: list[Endpoint] = []
     tools: list[ToolDefinition] = []
+    all_tags: set[str] = set()
 
     for rt in raw_tools:
         method_str = rt.get("method", "GET").upper()
@@ -172,6 +473,7 @@ def _raw_tools_to_canonical(raw_tools: list[dict], api_info: dict) -> tuple[APIS
             deprecated=rt.get("deprecated", False),
         )
         endpoints.append(ep)
+        all_tags.update(t for t in ep.tags if t)
 
         tools.append(ToolDefinition(
             name=rt.get("name", ""),
@@ -187,7 +489,7 @@ def _raw_tools_to_canonical(raw_tools: list[dict], api_info: dict) -> tuple[APIS
         description=api_info.get("description", ""),
         base_url=api_info.get("base_url", ""),
         endpoints=endpoints,
-        tags=sorted({t for ep in endpoints for tag in ep.tags for t in ([tag] if tag else [])}),
+        tags=sorted(all_tags),
     )
     return spec, tools
 
@@ -239,32 +541,27 @@ async def api_ingest(req: IngestRequest):
 
     Supports source_type: openapi, swagger, sdk, docs
     """
-    session_id = str(uuid.uuid4())[:8]
     raw_tools: list[dict] = []
 
+    cache_key = _ingest_cache_key(req.source, req.source_type)
+    cached = await asyncio.to_thread(_ingest_cache_get, cache_key)
+    if cached is not None:
+        api_spec, tools, raw_tools = cached
+
     try:
-        if req.source_type in ("openapi", "postman"):
+        if cached is not None:
+            pass  # fetch/parse/mine skipped — reusing the cached result above
+        elif req.source_type in ("openapi", "postman"):
             # ── Existing pipeline: ingest → mine → safety ──
-            api_spec = ingest(req.source)
-            tools = mine_tools(api_spec)
+            api_spec = await asyncio.to_thread(ingest, req.source)
+            tools = await asyncio.to_thread(mine_tools, api_spec)
             tools = apply_safety(tools)
             # Build raw_tools for discover step
-            raw_tools = [
-                {
-                    "name": t.name,
-                    "description": t.description,
-                    "method": t.endpoints[0].method.value if t.endpoints else "GET",
-                    "path": t.endpoints[0].path if t.endpoints else "/",
-                    "params": [{"name": p.name, "type": p.json_type, "required": p.required,
-                                "location": "body", "description": p.description} for p in t.params],
-                    "tags": t.tags,
-                }
-                for t in tools
-            ]
+            raw_tools = _tools_to_raw(tools)
 
         elif req.source_type == "swagger":
             # ── Prance-based parsing (better $ref resolution) ──
-            result = swagger_ingest(source=req.source, use_gemini=False)
+            result = await asyncio.to_thread(swagger_ingest, source=req.source, use_gemini=False)
             raw_tools = result.get("tools", [])
             api_spec, tools = _raw_tools_to_canonical(raw_tools, result.get("api_info", {}))
             tools = apply_safety(tools)
@@ -272,16 +569,16 @@ async def api_ingest(req: IngestRequest):
         elif req.source_type == "sdk":
             # ── SDK ingestion (GitHub repo or local) ──
             if req.source.startswith("http") and "github.com" in req.source:
-                result = sdk_ingest(source=req.source, source_type="github")
+                result = await asyncio.to_thread(sdk_ingest, source=req.source, source_type="github")
             else:
-                result = sdk_ingest(source=req.source, source_type="file")
+                result = await asyncio.to_thread(sdk_ingest, source=req.source, source_type="file")
             raw_tools = result.get("tools", [])
             api_spec, tools = _raw_tools_to_canonical(raw_tools, result.get("api_info", {}))
             tools = apply_safety(tools)
 
         elif req.source_type == "docs":
             # ── Gemini-based parsing for non-standard docs ──
-            result = swagger_ingest(source=req.source, use_gemini=True)
+            result = await asyncio.to_thread(swagger_ingest, source=req.source, use_gemini=True)
             raw_tools = result.get("tools", [])
             api_spec, tools = _raw_tools_to_canonical(raw_tools, result.get("api_info", {}))
             tools = apply_safety(tools)
@@ -294,83 +591,86 @@ async def api_ingest(req: IngestRequest):
     except Exception as e:
         raise HTTPException(status_code=400, detail=f"Ingestion failed: {e}")
 
-    # Run rule-based classification automatically
-    classifications = classify_tools(raw_tools, policy="moderate", use_gemini=False)
+    if cached is None:
+        await asyncio.to_thread(_ingest_cache_put, cache_key, (api_spec, tools, raw_tools))
 
-    _save_session(session_id, {
+    # Only successful ingests pay for a session id
+    session_id = secrets.token_hex(4)
+    sess = {
         "spec": api_spec,
         "tools": tools,
         "raw_tools": raw_tools,
-        "classifications": classifications,
+        "classifications": {},
         "generated": None,
         "output_dir": None,
-    })
-
-    return {
-        "session_id": session_id,
-        "source_type": req.source_type,
-        "spec": {
-            "title": api_spec.title,
-            "version": api_spec.version,
-            "description": api_spec.description,
-            "base_url": api_spec.base_url,
-            "tags": api_spec.tags,
-            "auth_schemes": [s.model_dump() for s in api_spec.auth_schemes],
-        },
-        "endpoints": _serialize_endpoints(api_spec.endpoints),
-        "tools": _serialize_tools(tools),
-        "classifications": classifications,
     }
 
+    # Rule-based classification and payload serialization are independent —
+    # run both on the threadpool concurrently.
+    classifications, payload = await asyncio.gather(
+        asyncio.to_thread(classify_tools, raw_tools, policy="moderate", use_gemini=False),
+        asyncio.to_thread(_build_session_payload, session_id, sess),
+    )
+    sess["classifications"] = classifications
+    payload["classifications"] = classifications
+    sess["payload"] = payload
+    _save_session(session_id, sess)
+
+    return StreamingResponse(
+        _stream_payload(payload, {"source_type": req.source_type}),
+        media_type="application/json",
+    )
+
 
 @app.get("/api/session/{session_id}")
-async def api_session(session_id: str):
-    """Get current session state."""
-    sess = _load_session(session_id)
-    if not sess:
+async def api_session(session_id: str, request: Request):
+    """Get current session state.
+
+    Sends a weak ETag derived from the session file's mtime/size; pollers
+    that present it back get a bodyless 304 for the unchanged case.
+    """
+    try:
+        st = (_SESSION_DIR / f"{session_id}.json").stat()
+    except FileNotFoundError:
         raise HTTPException(status_code=404, detail="Session not found")
 
-    api_spec = sess["spec"]
-    tools = sess["tools"]
+    etag = f'W/"{st.st_mtime_ns:x}-{st.st_size:x}"'
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
 
-    return {
-        "session_id": session_id,
-        "spec": {
-            "title": api_spec.title,
-            "version": api_spec.version,
-            "description": api_spec.description,
-            "base_url": api_spec.base_url,
-            "tags": api_spec.tags,
-        },
-        "endpoints": _serialize_endpoints(api_spec.endpoints),
-        "tools": _serialize_tools(tools),
-        "classifications": sess.get("classifications", {}),
-        "has_generated": sess["generated"] is not None,
-    }
+    sess = await asyncio.to_thread(_load_session, session_id)
+    if not sess:
+        raise HTTPException(status_code=404, detail="Session not found")
+
+    payload = sess.get("payload")
+    if payload is None:  # session written before payloads were precomputed
+        payload = _build_session_payload(session_id, sess)
+    return ORJSONResponse(payload, headers={"ETag": etag, "Cache-Control": "no-cache"})
 
 
 @app.post("/api/discover")
 async def api_discover(req: DiscoverRequest):
     """Stage 2: Classify tools for MCP exposure."""
-    sess = _load_session(req.session_id)
-    if not sess:
-        raise HTTPException(status_code=404, detail="Session not found")
-
-    raw_tools = sess.get("raw_tools", [])
-    if not raw_tools:
-        raise HTTPException(status_code=400, detail="No raw tools to classify. Run ingest first.")
+    async with SessionContext(req.session_id) as ctx:
+        if not ctx.data:
+            raise HTTPException(status_code=404, detail="Session not found")
 
-    try:
-        classifications = classify_tools(
-            raw_tools,
-            policy=req.policy,
-            use_gemini=req.use_gemini,
-        )
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Classification failed: {e}")
+        raw_tools = ctx.data.get("raw_tools", [])
+        if not raw_tools:
+            raise HTTPException(status_code=400, detail="No raw tools to classify. Run ingest first.")
 
-    sess["classifications"] = classifications
-    _save_session(req.session_id, sess)
+        try:
+            classifications = await asyncio.to_thread(
+                classify_tools,
+                raw_tools,
+                policy=req.policy,
+                use_gemini=req.use_gemini,
+            )
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=f"Classification failed: {e}")
+
+        ctx.data["classifications"] = classifications
+        ctx.dirty = True
 
     return classifications
 
@@ -381,119 +681,110 @@ async def api_ingest_upload(
     source_type: str = Form("openapi"),
 ):
     """Ingest from an uploaded YAML/JSON file."""
-    content = await file.read()
-    text = content.decode("utf-8")
-
-    suffix = ".yaml" if (file.filename or "").endswith((".yaml", ".yml")) else ".json"
-    tmp = tempfile.NamedTemporaryFile(mode="w", suffix=suffix, delete=False, encoding="utf-8")
     try:
-        tmp.write(text)
-        tmp.close()
-
-        session_id = str(uuid.uuid4())[:8]
         raw_tools: list[dict] = []
 
         if source_type in ("openapi", "postman"):
-            api_spec = ingest(tmp.name)
-            tools = mine_tools(api_spec)
+            # Parsed fully in memory — no tempfile write/unlink roundtrip
+            content = await file.read()
+            api_spec = await asyncio.to_thread(ingest, content)
+            tools = await asyncio.to_thread(mine_tools, api_spec)
             tools = apply_safety(tools)
-            raw_tools = [
-                {
-                    "name": t.name, "description": t.description,
-                    "method": t.endpoints[0].method.value if t.endpoints else "GET",
-                    "path": t.endpoints[0].path if t.endpoints else "/",
-                    "params": [{"name": p.name, "type": p.json_type, "required": p.required,
-                                "location": "body", "description": p.description} for p in t.params],
-                    "tags": t.tags,
-                }
-                for t in tools
-            ]
-        elif source_type == "swagger":
-            result = swagger_ingest(source=tmp.name, use_gemini=False)
-            raw_tools = result.get("tools", [])
-            api_spec, tools = _raw_tools_to_canonical(raw_tools, result.get("api_info", {}))
-            tools = apply_safety(tools)
-        elif source_type == "docs":
-            result = swagger_ingest(source=tmp.name, use_gemini=True)
+            raw_tools = _tools_to_raw(tools)
+        elif source_type in ("swagger", "docs"):
+            # Prance/Gemini need a real path — stream the upload to a tempfile
+            suffix = ".yaml" if (file.filename or "").endswith((".yaml", ".yml")) else ".json"
+            tmp = tempfile.NamedTemporaryFile(mode="wb", suffix=suffix, delete=False)
+            try:
+                while chunk := await file.read(1 << 20):
+                    await asyncio.to_thread(tmp.write, chunk)
+                tmp.close()
+                result = await asyncio.to_thread(
+                    swagger_ingest, source=tmp.name, use_gemini=(source_type == "docs")
+                )
+            finally:
+                await asyncio.to_thread(os.unlink, tmp.name)
             raw_tools = result.get("tools", [])
             api_spec, tools = _raw_tools_to_canonical(raw_tools, result.get("api_info", {}))
             tools = apply_safety(tools)
         else:
             raise ValueError(f"Unknown source_type: {source_type}")
 
-        classifications = classify_tools(raw_tools, policy="moderate", use_gemini=False)
-
-        _save_session(session_id, {
+        session_id = secrets.token_hex(4)
+        sess = {
             "spec": api_spec, "tools": tools, "raw_tools": raw_tools,
-            "classifications": classifications, "generated": None, "output_dir": None,
-        })
-
-        return {
-            "session_id": session_id,
-            "source_type": source_type,
-            "spec": {
-                "title": api_spec.title, "version": api_spec.version,
-                "description": api_spec.description, "base_url": api_spec.base_url,
-                "tags": api_spec.tags,
-                "auth_schemes": [s.model_dump() for s in api_spec.auth_schemes],
-            },
-            "endpoints": _serialize_endpoints(api_spec.endpoints),
-            "tools": _serialize_tools(tools),
-            "classifications": classifications,
+            "classifications": {}, "generated": None, "output_dir": None,
         }
+        classifications, payload = await asyncio.gather(
+            asyncio.to_thread(classify_tools, raw_tools, policy="moderate", use_gemini=False),
+            asyncio.to_thread(_build_session_payload, session_id, sess),
+        )
+        sess["classifications"] = classifications
+        payload["classifications"] = classifications
+        sess["payload"] = payload
+        _save_session(session_id, sess)
+
+        return StreamingResponse(
+            _stream_payload(payload, {"source_type": source_type}),
+            media_type="application/json",
+        )
     except HTTPException:
         raise
     except Exception as e:
         raise HTTPException(status_code=400, detail=f"Ingestion failed: {e}")
-    finally:
-        os.unlink(tmp.name)
 
 
 @app.post("/api/discover/confirm")
 async def api_discover_confirm(req: DiscoverConfirmRequest):
     """Confirm discovery: filter session tools to only the allowed ones."""
-    sess = _load_session(req.session_id)
-    if not sess:
-        raise HTTPException(status_code=404, detail="Session not found")
+    async with SessionContext(req.session_id) as ctx:
+        if not ctx.data:
+            raise HTTPException(status_code=404, detail="Session not found")
 
-    allowed_set = set(req.allowed_tools)
-    sess["tools"] = [t for t in sess["tools"] if t.name in allowed_set]
-    sess["raw_tools"] = [rt for rt in sess.get("raw_tools", []) if rt.get("name") in allowed_set]
+        allowed_set = frozenset(req.allowed_tools)
+        ctx.data["tools"] = [t for t in ctx.data["tools"] if t.name in allowed_set]
+        ctx.data["raw_tools"] = [
+            rt for rt in ctx.data.get("raw_tools", []) if rt.get("name") in allowed_set
+        ]
 
-    # Also filter spec endpoints
-    spec = sess["spec"]
-    spec.endpoints = [ep for ep in spec.endpoints if ep.operation_id in allowed_set]
-    sess["spec"] = spec
+        # Also filter spec endpoints
+        spec = ctx.data["spec"]
+        spec.endpoints = [ep for ep in spec.endpoints if ep.operation_id in allowed_set]
+        ctx.data["spec"] = spec
+        ctx.dirty = True
+        allowed_count = len(ctx.data["tools"])
 
-    _save_session(req.session_id, sess)
-    return {"status": "ok", "allowed_count": len(sess["tools"])}
+    return {"status": "ok", "allowed_count": allowed_count}
 
 
 @app.post("/api/policy")
 async def api_policy(req: PolicyUpdate):
     """Stage 4: Update tool policies (safety level, auto_execute, rate_limit)."""
-    sess = _load_session(req.session_id)
-    if not sess:
-        raise HTTPException(status_code=404, detail="Session not found")
-
-    tools = sess["tools"]
-    policy_map = {p["name"]: p for p in req.policies}
-
-    for tool in tools:
-        if tool.name in policy_map:
-            p = policy_map[tool.name]
-            if "safety" in p:
+    async with SessionContext(req.session_id) as ctx:
+        if not ctx.data:
+            raise HTTPException(status_code=404, detail="Session not found")
+
+        tools = ctx.data["tools"]
+        by_name = {t.name: t for t in tools}
+
+        # Walk the (usually tiny) policy list, not every tool — and skip the
+        # session rewrite entirely when nothing actually changed
+        changed = 0
+        for p in req.policies:
+            tool = by_name.get(p.get("name"))
+            if tool is not None and "safety" in p:
                 tool.safety = SafetyLevel(p["safety"])
+                changed += 1
+
+        ctx.dirty = changed > 0
 
-    sess["tools"] = tools
-    _save_session(req.session_id, sess)
     return {"status": "ok", "tool_count": len(tools)}
 
 
 @app.post("/api/generate")
 async def api_generate(req: GenerateRequest):
     """Stage 5: Generate the MCP server code (costs credits)."""
-    sess = _load_session(req.session_id)
+    sess = await asyncio.to_thread(_load_session, req.session_id)
     if not sess:
         raise HTTPException(status_code=404, detail="Session not found")
 
@@ -514,7 +805,9 @@ async def api_generate(req: GenerateRequest):
     output_dir = OUTPUT_ROOT / (name or api_spec.title.lower().replace(" ", "-") + "-mcp")
 
     try:
-        result = agentic_generate(api_spec, tools, server_name=name, output_dir=str(output_dir))
+        result = await asyncio.to_thread(
+            agentic_generate, api_spec, tools, server_name=name, output_dir=str(output_dir)
+        )
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Code generation failed: {e}")
 
@@ -532,35 +825,56 @@ async def api_generate(req: GenerateRequest):
 
     sess["generated"] = result
     sess["output_dir"] = str(output_dir)
+    sess.pop("payload", None)
     _save_session(req.session_id, sess)
 
-    # Read all generated files
-    files: dict[str, dict] = {}
-    if output_dir.exists():
-        for f in sorted(output_dir.iterdir()):
-            if f.is_file():
-                try:
-                    content = f.read_text(encoding="utf-8")
-                    files[f.name] = {
-                        "content": content,
-                        "lines": len(content.splitlines()),
-                        "lang": _detect_lang(f.name),
-                    }
-                except Exception:
-                    files[f.name] = {"content": "(binary file)", "lines": 0, "lang": ""}
+    # Stream the generated text files one at a time: first byte goes out after
+    # the first read, and peak memory is one file instead of the whole bundle.
+    # The emitted bytes still form the same single JSON document as before.
+    def _list_readable() -> list[Path]:
+        # scandir: is_file() comes from d_type and stat() is cached, so this
+        # is one syscall per entry instead of the two from iterdir + stat
+        try:
+            with os.scandir(output_dir) as it:
+                return [
+                    Path(e.path) for e in sorted(it, key=lambda e: e.name)
+                    if e.is_file()
+                    and (os.path.splitext(e.name)[1] in _TEXT_EXTS or e.name.startswith(".env"))
+                    and e.stat().st_size <= _MAX_INLINE_FILE_BYTES
+                ]
+        except FileNotFoundError:
+            return []
+
+    readable = await asyncio.to_thread(_list_readable)
+
+    async def _stream():
+        header = orjson.dumps({
+            "server_name": result.server_name,
+            "tool_count": result.tool_count,
+            "output_dir": str(output_dir),
+        })
+        yield header[:-1] + b',"files":{'  # reopen the object to append files
+        for i, f in enumerate(readable):
+            try:
+                content = await asyncio.to_thread(f.read_text, encoding="utf-8")
+                entry = {
+                    "content": content,
+                    "lines": content.count("\n") + 1,
+                    "lang": _detect_lang(f.name),
+                }
+            except Exception:
+                entry = {"content": "(binary file)", "lines": 0, "lang": ""}
+            sep = b"" if i == 0 else b","
+            yield sep + orjson.dumps(f.name) + b":" + orjson.dumps(entry)
+        yield b"}}"
 
-    return {
-        "server_name": result.server_name,
-        "tool_count": result.tool_count,
-        "output_dir": str(output_dir),
-        "files": files,
-    }
+    return StreamingResponse(_stream(), media_type="application/json")
 
 
 @app.post("/api/test")
 async def api_test(req: GenerateRequest):
     """Stage 6: Run the generated test suite."""
-    sess = _load_session(req.session_id)
+    sess = await asyncio.to_thread(_load_session, req.session_id)
     if not sess:
         raise HTTPException(status_code=404, detail="Session not found")
 
@@ -574,12 +888,8 @@ async def api_test(req: GenerateRequest):
 
     # Return the test file content — actual test execution would need
     # the upstream API running. For now we return the test structure.
-    test_code = test_file.read_text(encoding="utf-8")
-    test_names = [
-        line.strip().replace("async def ", "").replace("def ", "").split("(")[0]
-        for line in test_code.splitlines()
-        if line.strip().startswith(("async def test_", "def test_"))
-    ]
+    test_code = await asyncio.to_thread(test_file.read_text, encoding="utf-8")
+    test_names = _TEST_DEF_RE.findall(test_code)
 
     return {
         "test_file": test_code,
@@ -591,7 +901,7 @@ async def api_test(req: GenerateRequest):
 @app.post("/api/deploy")
 async def api_deploy(req: DeployRequest):
     """Stage 7: Deploy to GitHub."""
-    sess = _load_session(req.session_id)
+    sess = await asyncio.to_thread(_load_session, req.session_id)
     if not sess:
         raise HTTPException(status_code=404, detail="Session not found")
 
@@ -603,7 +913,8 @@ async def api_deploy(req: DeployRequest):
     api_spec = sess["spec"]
 
     try:
-        deploy_info = deploy_to_github(
+        deploy_info = await asyncio.to_thread(
+            deploy_to_github,
             output_dir=output_dir,
             repo_name=generated.server_name,
             description=f"Auto-generated MCP server for {api_spec.title}",
@@ -662,20 +973,32 @@ async def api_purchase_credits(req: CreditPurchaseRequest):
     }
 
 
+_EXT_LANG = {
+    ".py": "python",
+    ".json": "json",
+    ".toml": "toml",
+    ".txt": "text",
+    ".env": "env",
+    ".md": "markdown",
+    ".yaml": "yaml",
+    ".yml": "yaml",
+}
+
+
 def _detect_lang(filename: str) -> str:
-    ext_map = {
-        ".py": "python",
-        ".json": "json",
-        ".toml": "toml",
-        ".txt": "text",
-        ".env": "env",
-        ".md": "markdown",
-        ".yaml": "yaml",
-        ".yml": "yaml",
-    }
-    for ext, lang in ext_map.items():
-        if filename.endswith(ext):
-            return lang
+    ext = filename.rpartition(".")[2]
+    lang = _EXT_LANG.get(f".{ext}", "")
+    if lang:
+        return lang
     if filename.startswith(".env"):
         return "env"
     return ""
+
+
+if __name__ == "__main__":
+    import uvloop
+
+    uvloop.install()
+    import uvicorn
+
+    uvicorn.run("api_server:app", loop="uvloop", http="httptools", port=8080)
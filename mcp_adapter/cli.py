@@ -18,15 +18,16 @@ from dotenv import load_dotenv
 
 load_dotenv()
 
-from .agentic_codegen import generate as agentic_generate
-from .deploy import deploy as deploy_to_github
 from .ingest import ingest
 from .logger import setup_logging, get_logger
 from .mine import mine_tools
 from .models import SafetyLevel
-from .reasoning import enhance_tools_with_k2
 from .safety import SafetyPolicy, apply_safety
 
+# agentic_codegen, deploy and reasoning are imported inside generate_cmd:
+# they pull in the LLM/deploy stack, which `inspect` never needs, and
+# keeping them lazy takes seconds off CLI startup for the light commands.
+
 
 @click.group()
 @click.version_option(version="0.2.0", prog_name="mcp-adapter")
@@ -116,6 +117,10 @@ def generate_cmd(
     github_org: str | None,
 ):
     """Generate an MCP server from an API specification."""
+    from .agentic_codegen import generate as agentic_generate
+    from .deploy import deploy as deploy_to_github
+    from .reasoning import enhance_tools_with_k2
+
     logger = get_logger()
 
     if not spec and not url:
@@ -12,19 +12,39 @@ Requires:
 
 from __future__ import annotations
 
-import json
+import base64
+import hashlib
 import os
 import subprocess
+import threading
 import webbrowser
+from functools import lru_cache
 from pathlib import Path
 
 import httpx
+import orjson
 
 from .logger import get_logger
 
 GITHUB_API = "https://api.github.com"
 DEDALUS_DASHBOARD = "https://www.dedaluslabs.ai/dashboard/servers"
 
+# Shared keep-alive client: the handful of API calls per deploy (user
+# lookup, create, exists-fetch) reuse one TLS connection instead of
+# paying a fresh handshake each. Created lazily so importing this module
+# never opens sockets.
+_github_client_instance: httpx.Client | None = None
+_github_client_lock = threading.Lock()
+
+
+def _github_client() -> httpx.Client:
+    global _github_client_instance
+    if _github_client_instance is None:
+        with _github_client_lock:
+            if _github_client_instance is None:
+                _github_client_instance = httpx.Client(base_url=GITHUB_API, timeout=15.0)
+    return _github_client_instance
+
 
 def _get_github_token() -> str:
     token = os.getenv("GITHUB_TOKEN", "")
@@ -45,9 +65,14 @@ def _github_headers(token: str) -> dict[str, str]:
     }
 
 
+@lru_cache(maxsize=8)
 def _get_github_username(token: str) -> str:
-    """Get the authenticated user's GitHub username."""
-    resp = httpx.get(f"{GITHUB_API}/user", headers=_github_headers(token), timeout=15.0)
+    """Get the authenticated user's GitHub username.
+
+    Cached per token — the username can't change under the same token,
+    so 422 retries and repeated deploys skip the extra API round-trip.
+    """
+    resp = _github_client().get("/user", headers=_github_headers(token))
     resp.raise_for_status()
     return resp.json()["login"]
 
@@ -74,25 +99,23 @@ def create_github_repo(
     }
 
     if org:
-        url = f"{GITHUB_API}/orgs/{org}/repos"
+        url = f"/orgs/{org}/repos"
     else:
-        url = f"{GITHUB_API}/user/repos"
+        url = "/user/repos"
 
-    resp = httpx.post(
+    resp = _github_client().post(
         url,
         headers=_github_headers(token),
         json=payload,
-        timeout=15.0,
     )
 
     if resp.status_code == 422:
         # Repo likely already exists — fetch it instead
         owner = org or _get_github_username(token)
         logger.info("  Repo %s/%s already exists — reusing", owner, name)
-        resp2 = httpx.get(
-            f"{GITHUB_API}/repos/{owner}/{name}",
+        resp2 = _github_client().get(
+            f"/repos/{owner}/{name}",
             headers=_github_headers(token),
-            timeout=15.0,
         )
         resp2.raise_for_status()
         return resp2.json()
@@ -116,8 +139,28 @@ def _run_git(args: list[str], cwd: str) -> str:
     return result.stdout.strip()
 
 
+def _git_returncode(args: list[str], cwd: str) -> int:
+    """Run a git command for its exit code only (never raises on failure)."""
+    result = subprocess.run(["git"] + args, cwd=cwd, capture_output=True, timeout=60)
+    return result.returncode
+
+
+# Committer identity passed as per-invocation -c flags — saves the
+# config-probe + two config-set subprocesses on every fresh output dir.
+_GIT_IDENTITY = [
+    "-c", "user.email=mcp-adapter@dedaluslabs.ai",
+    "-c", "user.name=MCP Adapter Generator",
+]
+
+
 def push_to_github(output_dir: str | Path, repo_url: str, *, branch: str = "main") -> None:
-    """Initialize a git repo in output_dir and push to GitHub."""
+    """Initialize a git repo in output_dir and push to GitHub.
+
+    Each git call is a fork+exec, so the sequence is kept minimal: no
+    config round-trips, staged-change detection via the exit code of
+    `git diff --cached --quiet` instead of parsing `git status`, and a
+    single remote add with set-url as the re-deploy fallback.
+    """
     logger = get_logger()
     cwd = str(output_dir)
 
@@ -127,13 +170,6 @@ def push_to_github(output_dir: str | Path, repo_url: str, *, branch: str = "main
         _run_git(["init", "-b", branch], cwd)
         logger.info("  Initialized git repo")
 
-    # Configure git user if not set (needed for commits)
-    try:
-        _run_git(["config", "user.email"], cwd)
-    except RuntimeError:
-        _run_git(["config", "user.email", "mcp-adapter@dedaluslabs.ai"], cwd)
-        _run_git(["config", "user.name", "MCP Adapter Generator"], cwd)
-
     # Add .gitignore
     gitignore = Path(cwd) / ".gitignore"
     if not gitignore.exists():
@@ -142,29 +178,101 @@ def push_to_github(output_dir: str | Path, repo_url: str, *, branch: str = "main
             encoding="utf-8",
         )
 
-    # Stage and commit
+    # Stage and commit (exit code 1 from diff --cached = staged changes)
     _run_git(["add", "-A"], cwd)
-
-    # Check if there are changes to commit
-    status = _run_git(["status", "--porcelain"], cwd)
-    if status:
-        _run_git(["commit", "-m", "Auto-generated MCP server"], cwd)
+    if _git_returncode(["diff", "--cached", "--quiet"], cwd) != 0:
+        _run_git([*_GIT_IDENTITY, "commit", "-m", "Auto-generated MCP server"], cwd)
         logger.info("  Committed changes")
     else:
         logger.info("  No changes to commit")
 
-    # Set remote (replace if exists)
-    try:
-        _run_git(["remote", "remove", "origin"], cwd)
-    except RuntimeError:
-        pass
-    _run_git(["remote", "add", "origin", repo_url], cwd)
+    # Set remote (one subprocess when absent; set-url covers re-deploys)
+    if _git_returncode(["remote", "add", "origin", repo_url], cwd) != 0:
+        _run_git(["remote", "set-url", "origin", repo_url], cwd)
 
     # Push
     _run_git(["push", "-u", "origin", branch, "--force"], cwd)
     logger.info("  Pushed to %s", repo_url)
 
 
+# A typical generated MCP server is a handful of small text files — for
+# those, uploading through the REST contents API skips git entirely (no
+# subprocess spawns, no clone/push handshake). Larger trees fall back to
+# the normal git push.
+_CONTENTS_API_MAX_FILES = 30
+_CONTENTS_API_MAX_BYTES = 1 << 20
+
+# Mirrors the .gitignore written by push_to_github — secrets and caches
+# must not be uploaded through the contents API either
+_UPLOAD_SKIP_PARTS = frozenset({".git", ".env", "__pycache__", ".venv"})
+
+
+def _git_blob_sha(content: bytes) -> str:
+    """sha1 of a git blob object — matches the sha GitHub reports for a file."""
+    h = hashlib.sha1(b"blob %d\0" % len(content))
+    h.update(content)
+    return h.hexdigest()
+
+
+def _push_via_contents_api(
+    output_dir: str | Path, repo_full_name: str, token: str, *, branch: str = "main"
+) -> bool:
+    """Upload a small output dir through the GitHub contents API.
+
+    Files whose blob sha already matches the remote are skipped. Uploads
+    are sequential on purpose: each PUT creates a commit, and concurrent
+    commits on one branch make GitHub return 409s. Returns False when
+    the tree is too large for this path; raises on API errors so the
+    caller can fall back to a git push.
+    """
+    logger = get_logger()
+
+    files: list[tuple[str, bytes]] = []
+    total = 0
+    for path in sorted(Path(output_dir).rglob("*")):
+        rel_parts = path.relative_to(output_dir).parts
+        if not path.is_file() or any(part in _UPLOAD_SKIP_PARTS or part.endswith(".pyc") for part in rel_parts):
+            continue
+        data = path.read_bytes()
+        total += len(data)
+        files.append(("/".join(rel_parts), data))
+        if len(files) > _CONTENTS_API_MAX_FILES or total > _CONTENTS_API_MAX_BYTES:
+            return False
+
+    headers = _github_headers(token)
+    client = _github_client()
+
+    # Existing blob shas: unchanged files are skipped, changed ones carry
+    # the sha the API requires for updates. 404/409 = empty or new repo.
+    shas: dict[str, str] = {}
+    resp = client.get(f"/repos/{repo_full_name}/git/trees/{branch}?recursive=1", headers=headers)
+    if resp.status_code not in (404, 409):
+        resp.raise_for_status()
+        shas = {
+            e["path"]: e["sha"]
+            for e in resp.json().get("tree", [])
+            if e.get("type") == "blob"
+        }
+
+    uploaded = 0
+    for rel, data in files:
+        if shas.get(rel) == _git_blob_sha(data):
+            continue
+        payload: dict = {
+            "message": f"Update {rel}",
+            "content": base64.b64encode(data).decode(),
+            "branch": branch,
+        }
+        if rel in shas:
+            payload["sha"] = shas[rel]
+        r = client.put(f"/repos/{repo_full_name}/contents/{rel}", headers=headers, json=payload)
+        r.raise_for_status()
+        uploaded += 1
+
+    logger.info("  Uploaded %d file(s) via contents API (%d unchanged)", uploaded, len(files) - uploaded)
+    return True
+
+
 def open_dedalus_dashboard() -> None:
     """Open the Dedalus dashboard in the user's browser."""
     logger = get_logger()
@@ -172,12 +280,23 @@ def open_dedalus_dashboard() -> None:
     webbrowser.open(DEDALUS_DASHBOARD)
 
 
+@lru_cache(maxsize=32)
+def _read_manifest_cached(path: str, mtime_ns: int) -> dict:
+    return orjson.loads(Path(path).read_bytes())
+
+
 def _read_manifest(output_dir: str | Path) -> dict:
-    """Read dedalus.json manifest from the output directory."""
+    """Read dedalus.json manifest from the output directory.
+
+    Memoized on (path, mtime) so repeated deploys of an unchanged output
+    dir skip the read+parse; edits invalidate via the mtime key.
+    """
     manifest_path = Path(output_dir) / "dedalus.json"
-    if manifest_path.exists():
-        return json.loads(manifest_path.read_text(encoding="utf-8"))
-    return {}
+    try:
+        mtime_ns = manifest_path.stat().st_mtime_ns
+    except FileNotFoundError:
+        return {}
+    return dict(_read_manifest_cached(str(manifest_path), mtime_ns))
 
 
 def deploy(
@@ -213,9 +332,15 @@ def deploy(
     repo_full_name = repo_info["full_name"]
     html_url = repo_info["html_url"]
 
-    # Step 2: Push code
+    # Step 2: Push code — contents API for small trees, git otherwise
     logger.info("Pushing generated code to GitHub...")
-    push_to_github(output_dir, repo_url)
+    pushed = False
+    try:
+        pushed = _push_via_contents_api(output_dir, repo_full_name, token)
+    except Exception as e:
+        logger.warning("  Contents-API upload failed (%s) — falling back to git push", e)
+    if not pushed:
+        push_to_github(output_dir, repo_url)
 
     # Step 3: Open Dedalus dashboard
     if open_dashboard:
@@ -17,15 +17,31 @@ Usage:
 from __future__ import annotations
 
 import argparse
+import hashlib
 import json
 import os
+import re
+import sqlite3
 import sys
+import threading
 import time
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
+from enum import IntEnum
+from itertools import islice
+
+import orjson
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Literal
+from typing import Any, Iterable, Literal
 
 from dotenv import load_dotenv
 
+try:
+    import ahocorasick
+except ImportError:  # fall back to compiled alternation regexes below
+    ahocorasick = None
+
 from .logger import get_logger
 
 load_dotenv()
@@ -70,149 +86,303 @@ CLASSIFICATION_RULES = {
 }
 
 
-def apply_rules(tool: dict, policy: PolicyType) -> dict:
-    """Apply rule-based classification to a tool."""
-    name = tool.get("name", "").lower()
-    method = tool.get("method", "").upper()
-    description = tool.get("description", "").lower()
-    path = tool.get("path", "").lower()
-    
+# O(1) method dispatch — derived once from CLASSIFICATION_RULES so the
+# rule table stays the single source of truth
+SAFE_METHODS = frozenset(CLASSIFICATION_RULES["safe_methods"])
+UNSAFE_METHODS = frozenset(CLASSIFICATION_RULES["unsafe_methods"])
+WRITE_METHODS = frozenset({"POST", "PUT", "PATCH"})
+
+# Keyword lists scanned against the combined text; auth keywords are kept
+# apart because they only ever scan name+path.
+_TEXT_CATEGORIES = {
+    "unsafe": CLASSIFICATION_RULES["unsafe_keywords"],
+    "billing": CLASSIFICATION_RULES["billing_keywords"],
+    "safe": CLASSIFICATION_RULES["safe_keywords"],
+}
+
+
+def _build_automaton(categories: dict[str, list[str]]) -> "ahocorasick.Automaton":
+    """Compile keyword lists into one Aho-Corasick automaton.
+
+    Payload per keyword is (category, keyword) so a single pass over the
+    text recovers which rule list the hit came from.
+    """
+    auto = ahocorasick.Automaton()
+    for category, keywords in categories.items():
+        for kw in keywords:
+            auto.add_word(kw, (category, kw))
+    auto.make_automaton()
+    return auto
+
+
+if ahocorasick is not None:
+    # Preferred matcher: one C-level DFA pass over the combined text
+    # replaces ~35 Python-level `kw in text` scans per tool.
+    _TEXT_AUTOMATON = _build_automaton(_TEXT_CATEGORIES)
+    _AUTH_AUTOMATON = _build_automaton({"auth": CLASSIFICATION_RULES["auth_keywords"]})
+
+    def _scan_keywords(text: str) -> dict[str, str]:
+        """Single automaton pass; returns the earliest hit per category."""
+        hits: dict[str, str] = {}
+        for _end, (category, kw) in _TEXT_AUTOMATON.iter(text):
+            if category not in hits:
+                hits[category] = kw
+                if len(hits) == 3:
+                    break
+        return hits
+
+    def _scan_auth(text: str) -> str | None:
+        hit = next(_AUTH_AUTOMATON.iter(text), None)
+        return hit[1][1] if hit else None
+
+else:
+    # Fallback matcher without the optional dependency: one precompiled
+    # alternation regex per category — still a C-level scan each, just
+    # three passes instead of one. Plain substrings (no \b) on purpose:
+    # word boundaries would stop 'list' matching 'listing' or 'delete'
+    # matching 'undeleted', changing classifications.
+    _TEXT_RES = {
+        category: re.compile("|".join(
+            re.escape(kw) for kw in sorted(keywords, key=len, reverse=True)
+        ))
+        for category, keywords in _TEXT_CATEGORIES.items()
+    }
+    _AUTH_RE = re.compile("|".join(
+        re.escape(kw) for kw in sorted(CLASSIFICATION_RULES["auth_keywords"], key=len, reverse=True)
+    ))
+
+    def _scan_keywords(text: str) -> dict[str, str]:
+        """One compiled-regex search per category; earliest hit each."""
+        hits: dict[str, str] = {}
+        for category, pattern in _TEXT_RES.items():
+            m = pattern.search(text)
+            if m:
+                hits[category] = m.group(0)
+        return hits
+
+    def _scan_auth(text: str) -> str | None:
+        m = _AUTH_RE.search(text)
+        return m.group(0) if m else None
+
+
+class Expose(IntEnum):
+    """Internal expose decision; small ints compare and hash faster than
+    the mixed True/False/"review" tri-state the JSON output uses."""
+
+    BLOCK = 0
+    REVIEW = 1
+    ALLOW = 2
+
+
+# Mapping to the tri-state the JSON output (and Gemini prompt) has always
+# used — applied only at the dict boundary in apply_rules
+_EXPOSE_TO_JSON = {Expose.BLOCK: False, Expose.REVIEW: "review", Expose.ALLOW: True}
+
+
+@lru_cache(maxsize=8192)
+def _classify_normalized(
+    name: str, method: str, description: str, path: str, policy: str
+) -> tuple:
+    """Pure classification core over pre-normalized (lowered/uppered) fields.
+
+    Deterministic in its inputs, so SDK duplicates (pagination variants,
+    regional copies) become an lru_cache hit instead of a rescan. Returns
+    a (classification, Expose, reason, confidence) tuple — callers mutate
+    the result dict, so the cache must not hand out shared dicts.
+    """
+    # DELETE is unsafe no matter what the text says — skip the scans
+    if method in UNSAFE_METHODS:
+        return ("unsafe", Expose.BLOCK, f"Destructive {method} operation", 0.95)
+
     combined_text = f"{name} {description} {path}"
-    
+    hits = _scan_keywords(combined_text)
+
     # Check for unsafe keywords first
-    for kw in CLASSIFICATION_RULES["unsafe_keywords"]:
-        if kw in combined_text:
-            return {
-                "classification": "unsafe",
-                "expose": False,
-                "reason": f"Contains destructive keyword: '{kw}'",
-                "confidence": 0.9
-            }
-    
+    if "unsafe" in hits:
+        return ("unsafe", Expose.BLOCK, f"Contains destructive keyword: '{hits['unsafe']}'", 0.9)
+
     # Check for billing/payment
-    for kw in CLASSIFICATION_RULES["billing_keywords"]:
-        if kw in combined_text:
-            return {
-                "classification": "unsafe",
-                "expose": False,
-                "reason": f"Billing/payment operation: '{kw}'",
-                "confidence": 0.85
-            }
-    
-    # Check for auth operations
-    for kw in CLASSIFICATION_RULES["auth_keywords"]:
-        if kw in name or kw in path:  # Stricter check for auth
-            return {
-                "classification": "unsafe",
-                "expose": False,
-                "reason": f"Authentication/security operation: '{kw}'",
-                "confidence": 0.8
-            }
-    
+    if "billing" in hits:
+        return ("unsafe", Expose.BLOCK, f"Billing/payment operation: '{hits['billing']}'", 0.85)
+
+    # Check for auth operations (stricter: name/path only)
+    auth_kw = _scan_auth(f"{name} {path}")
+    if auth_kw:
+        return ("unsafe", Expose.BLOCK, f"Authentication/security operation: '{auth_kw}'", 0.8)
+
+    safe_kw = hits.get("safe")
+
     # Check HTTP method
-    if method in CLASSIFICATION_RULES["safe_methods"]:
+    if method in SAFE_METHODS:
         # Safe methods with safe keywords = definitely safe
-        for kw in CLASSIFICATION_RULES["safe_keywords"]:
-            if kw in combined_text:
-                return {
-                    "classification": "safe",
-                    "expose": True,
-                    "reason": f"Read-only {method} operation with safe keyword: '{kw}'",
-                    "confidence": 0.95
-                }
+        if safe_kw:
+            return ("safe", Expose.ALLOW, f"Read-only {method} operation with safe keyword: '{safe_kw}'", 0.95)
         # Safe method without clear indicators
-        return {
-            "classification": "safe",
-            "expose": True,
-            "reason": f"Read-only {method} operation",
-            "confidence": 0.8
-        }
-    
-    if method in CLASSIFICATION_RULES["unsafe_methods"]:
-        return {
-            "classification": "unsafe",
-            "expose": False,
-            "reason": f"Destructive {method} operation",
-            "confidence": 0.95
-        }
-    
+        return ("safe", Expose.ALLOW, f"Read-only {method} operation", 0.8)
+
     # POST/PUT/PATCH - depends on policy
-    if method in ["POST", "PUT", "PATCH"]:
+    if method in WRITE_METHODS:
         if policy == "conservative":
-            return {
-                "classification": "conditional",
-                "expose": False,
-                "reason": f"Write operation ({method}) blocked by conservative policy",
-                "confidence": 0.7
-            }
+            return ("conditional", Expose.BLOCK, f"Write operation ({method}) blocked by conservative policy", 0.7)
         elif policy == "moderate":
             # Check for safe keywords
-            for kw in CLASSIFICATION_RULES["safe_keywords"]:
-                if kw in combined_text:
-                    return {
-                        "classification": "conditional",
-                        "expose": True,
-                        "reason": f"Write operation with safe context: '{kw}'",
-                        "confidence": 0.6
-                    }
+            if safe_kw:
+                return ("conditional", Expose.ALLOW, f"Write operation with safe context: '{safe_kw}'", 0.6)
             # Create/Update operations are generally OK
             if "create" in combined_text or "update" in combined_text:
-                return {
-                    "classification": "conditional",
-                    "expose": True,
-                    "reason": "Standard create/update operation",
-                    "confidence": 0.65
-                }
-            return {
-                "classification": "conditional",
-                "expose": "review",
-                "reason": f"Write operation ({method}) needs manual review",
-                "confidence": 0.5
-            }
+                return ("conditional", Expose.ALLOW, "Standard create/update operation", 0.65)
+            return ("conditional", Expose.REVIEW, f"Write operation ({method}) needs manual review", 0.5)
         else:  # permissive
-            return {
-                "classification": "conditional",
-                "expose": True,
-                "reason": f"Write operation ({method}) allowed by permissive policy",
-                "confidence": 0.6
-            }
-    
+            return ("conditional", Expose.ALLOW, f"Write operation ({method}) allowed by permissive policy", 0.6)
+
     # Unknown - needs review
+    return ("unknown", Expose.REVIEW, "Unable to classify automatically", 0.3)
+
+
+def apply_rules(tool: dict, policy: PolicyType) -> dict:
+    """Apply rule-based classification to a tool."""
+    classification, expose, reason, confidence = _classify_normalized(
+        tool.get("name", "").lower(),
+        tool.get("method", "").upper(),
+        tool.get("description", "").lower(),
+        tool.get("path", "").lower(),
+        policy,
+    )
     return {
-        "classification": "unknown",
-        "expose": "review",
-        "reason": "Unable to classify automatically",
-        "confidence": 0.3
+        "classification": classification,
+        "expose": _EXPOSE_TO_JSON[expose],
+        "reason": reason,
+        "confidence": confidence,
     }
 
 
 # ── Gemini Classification ─────────────────────────────────────────────────────
 
+# Bounded fan-out for Gemini batches: enough in-flight requests to hide
+# network latency, while the shared token bucket keeps the aggregate
+# request rate inside the provider quota.
+_GEMINI_CONCURRENCY = 8
+_GEMINI_REQUESTS_PER_MINUTE = int(os.getenv("GEMINI_RPM", "60"))
+
+# Featherless reasoning calls (multi-second each); 120/min matches the
+# previous 0.5s-per-call pacing, now shared across workers
+_REASONING_CONCURRENCY = 8
+_REASONING_REQUESTS_PER_MINUTE = int(os.getenv("FEATHERLESS_RPM", "120"))
+
+
+# Lazily constructed singletons: each client owns a TLS pool and auth
+# metadata, so rebuilding one per call threw away keep-alive connections
+# between batches (and between successive classify calls in one process).
+_gemini_client: Any = None
+_featherless_client: Any = None
+_client_lock = threading.Lock()
+
+
+def _get_gemini_client() -> Any:
+    """Memoized google-genai client (raises if GEMINI_API_KEY is unset)."""
+    global _gemini_client
+    if _gemini_client is None:
+        with _client_lock:
+            if _gemini_client is None:
+                from google import genai
+
+                api_key = os.getenv("GEMINI_API_KEY")
+                if not api_key:
+                    raise ValueError("GEMINI_API_KEY required for Gemini classification")
+                _gemini_client = genai.Client(api_key=api_key)
+    return _gemini_client
+
+
+def _get_featherless_client() -> Any:
+    """Memoized Featherless OpenAI client, or None when no key is set."""
+    global _featherless_client
+    if _featherless_client is None:
+        with _client_lock:
+            if _featherless_client is None:
+                api_key = os.getenv("DEDALUS_API_KEY")
+                if not api_key:
+                    return None
+                from openai import OpenAI
+
+                _featherless_client = OpenAI(
+                    base_url="https://api.featherless.ai/v1",
+                    api_key=api_key,
+                )
+    return _featherless_client
+
+
+class _RateLimiter:
+    """Minimal token bucket shared across worker threads."""
+
+    def __init__(self, rate_per_minute: int):
+        self._interval = 60.0 / rate_per_minute
+        self._next = 0.0
+        self._lock = threading.Lock()
+
+    def wait(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next)
+            self._next = start + self._interval
+        if start > now:
+            time.sleep(start - now)
+
+
+class _BatchTuner:
+    """Adapts the Gemini batch size to observed call outcomes.
+
+    Bigger batches amortize the static prompt prefix better while the
+    provider is responsive; smaller ones recover faster from throttling
+    and parse failures. Grows 1.5x (capped) after a fast success, halves
+    (floored) after a failure, and holds steady on slow successes. State
+    persists across classify calls in one process.
+    """
 
-def classify_batch_with_gemini(
-    tools: list[dict],
-    policy: PolicyType,
-    batch_size: int = 20
-) -> list[dict]:
-    """Classify tools in batches using Gemini 2.5 Flash."""
-    from google import genai
-    
-    api_key = os.getenv("GEMINI_API_KEY")
-    if not api_key:
-        raise ValueError("GEMINI_API_KEY required for Gemini classification")
-    
-    client = genai.Client(api_key=api_key)
-    results = []
-    
-    for i in range(0, len(tools), batch_size):
-        batch = tools[i:i + batch_size]
-        logger.info("Classifying batch %d/%d", i//batch_size + 1, (len(tools)-1)//batch_size + 1)
-        
-        # Create prompt for batch classification
-        tools_json = json.dumps(batch, indent=2)
-        prompt = f"""You are an API security classifier. Analyze these API tools and classify each one.
-
-## Policy: {policy.upper()}
+    def __init__(
+        self,
+        initial: int = 20,
+        floor: int = 5,
+        ceiling: int = 100,
+        target_latency: float = 10.0,
+    ):
+        self._size = initial
+        self._floor = floor
+        self._ceiling = ceiling
+        self._target = target_latency
+        self._latencies: deque[float] = deque(maxlen=10)
+        self._lock = threading.Lock()
+
+    @property
+    def size(self) -> int:
+        with self._lock:
+            return self._size
+
+    def record(self, elapsed: float, success: bool) -> None:
+        with self._lock:
+            self._latencies.append(elapsed)
+            if not success:
+                self._size = max(self._floor, self._size // 2)
+            elif elapsed < self._target:
+                self._size = min(self._ceiling, int(self._size * 1.5))
+
+
+_GEMINI_TUNER = _BatchTuner()
+
+_GEMINI_MODEL = "gemini-2.5-flash"
+
+# Markdown code fence around a JSON payload; one C-level regex scan
+# replaces the old Python loop walking lines backward for the closing ```
+_FENCE_RE = re.compile(r"```(?:json)?\s*\n?(.*?)\n?```", re.DOTALL)
+
+
+# Static instruction block, byte-identical across every batch and every
+# policy — all three policies are described up front and the selected one
+# is named only in the dynamic tail. Keeping all variable content at the
+# end maximizes the shared prefix for provider-side caching (explicit
+# below, implicit otherwise).
+_CLASSIFIER_PREFIX = """You are an API security classifier. Analyze these API tools and classify each one.
+
+## Policies
 - conservative: Only expose read-only (GET) operations
 - moderate: Expose reads + safe writes (create/update), block deletes and sensitive ops
 - permissive: Expose everything except destructive and security-sensitive operations
@@ -222,63 +392,281 @@ def classify_batch_with_gemini(
 - "unsafe": Destructive, billing, auth - never expose
 - "conditional": Write operations - depends on policy
 
-## Tools to Classify
-{tools_json}
-
 ## Output Format
 Return ONLY a JSON array with one object per tool:
 ```json
 [
-  {{
+  {
     "name": "tool_name",
     "classification": "safe|unsafe|conditional",
     "expose": true|false|"review",
     "reason": "Brief explanation",
     "confidence": 0.0-1.0
-  }}
+  }
 ]
-```
+```"""
+
+
+# Explicit context cache for the prefix above: caching its KV state
+# server-side means each request only prefills its dynamic tail (and
+# bills cached tokens at a fraction of the price). One cache now serves
+# all policies. Best-effort — None means "send full prompts".
+_gemini_prompt_caches: dict[str, Any] = {}
+
+
+def _get_prompt_cache(client: Any) -> Any:
+    if "static" not in _gemini_prompt_caches:
+        with _client_lock:
+            if "static" not in _gemini_prompt_caches:
+                cache_name = None
+                try:
+                    from google.genai import types
+
+                    cache = client.caches.create(
+                        model=_GEMINI_MODEL,
+                        config=types.CreateCachedContentConfig(
+                            contents=[_CLASSIFIER_PREFIX],
+                            ttl="600s",
+                        ),
+                    )
+                    cache_name = cache.name
+                    logger.info("Created Gemini context cache for classifier prompts")
+                except Exception as e:
+                    logger.info("Context cache unavailable (%s) — sending full prompts", e)
+                _gemini_prompt_caches["static"] = cache_name
+    return _gemini_prompt_caches["static"]
 
-Classify each tool based on its name, method, path, and description."""
 
+def classify_batch_with_gemini(
+    tools: Iterable[dict],
+    policy: PolicyType,
+    batch_size: int | None = None
+) -> list[dict]:
+    """Classify tools in batches using Gemini 2.5 Flash.
+
+    Accepts any iterable (a generator is fine — batching uses islice, so
+    only batch_size tools are materialized per step before fan-out).
+    When batch_size is None the shared tuner picks it from recent call
+    outcomes. Batches fan out over a bounded thread pool so their
+    network latency overlaps; the token bucket replaces the old fixed
+    1s sleep between batches. Result order matches the input order.
+    """
+    client = _get_gemini_client()
+    if batch_size is None:
+        batch_size = _GEMINI_TUNER.size
+    tools_iter = iter(tools)
+    batches = []
+    while batch := list(islice(tools_iter, batch_size)):
+        batches.append(batch)
+    limiter = _RateLimiter(_GEMINI_REQUESTS_PER_MINUTE)
+
+    def _generate(batch: list[dict]) -> Any:
+        # sort_keys keeps repeated tool dicts byte-identical, so re-runs of
+        # the same spec share maximal prefixes for implicit caching too
+        dynamic = (
+            f"## Selected Policy: {policy.upper()}\n\n"
+            f"## Tools to Classify\n{json.dumps(batch, indent=2, sort_keys=True)}\n\n"
+            "Classify each tool based on its name, method, path, and description."
+        )
+        from google.genai import types
+
+        cache_name = _get_prompt_cache(client)
+        if cache_name:
+            try:
+                return client.models.generate_content(
+                    model=_GEMINI_MODEL,
+                    contents=dynamic,
+                    config=types.GenerateContentConfig(
+                        cached_content=cache_name,
+                        response_mime_type="application/json",
+                    ),
+                )
+            except Exception:
+                # Cache likely expired mid-run — rebuild lazily next time
+                with _client_lock:
+                    _gemini_prompt_caches.pop("static", None)
+        return client.models.generate_content(
+            model=_GEMINI_MODEL,
+            contents=f"{_CLASSIFIER_PREFIX}\n\n{dynamic}",
+            config=types.GenerateContentConfig(response_mime_type="application/json"),
+        )
+
+    def _classify_batch(batch_index: int, batch: list[dict]) -> list[dict]:
+        logger.info("Classifying batch %d/%d", batch_index + 1, len(batches))
+
+        started = time.monotonic()
         try:
-            response = client.models.generate_content(
-                model="gemini-2.5-flash",
-                contents=prompt,
-            )
-            
+            limiter.wait()
+            started = time.monotonic()  # exclude limiter wait from latency
+            response = _generate(batch)
+
             response_text = response.text.strip()
-            
-            # Clean up response
-            if response_text.startswith("```"):
-                lines = response_text.split("\n")
-                end_idx = len(lines) - 1
-                for j in range(len(lines) - 1, 0, -1):
-                    if lines[j].strip() == "```":
-                        end_idx = j
-                        break
-                response_text = "\n".join(lines[1:end_idx])
-            
-            if not response_text.startswith("["):
-                start = response_text.find("[")
-                end = response_text.rfind("]") + 1
-                if start != -1 and end > start:
-                    response_text = response_text[start:end]
-            
-            batch_results = json.loads(response_text)
-            results.extend(batch_results)
-            
-            # Rate limiting
-            time.sleep(1)
-            
+
+            # response_mime_type asks for bare JSON, so the fast path is a
+            # straight parse; fence-stripping stays as a belt-and-braces
+            # fallback for models/proxies that ignore the mime hint
+            try:
+                parsed = orjson.loads(response_text)
+            except orjson.JSONDecodeError:
+                m = _FENCE_RE.search(response_text)
+                if m:
+                    response_text = m.group(1)
+
+                if not response_text.startswith("["):
+                    start = response_text.find("[")
+                    end = response_text.rfind("]") + 1
+                    if start != -1 and end > start:
+                        response_text = response_text[start:end]
+
+                parsed = orjson.loads(response_text)
+
+            # The model occasionally drops or invents entries; a short list
+            # would leave unclassified slots and a misaligned one would pin
+            # results to the wrong tools (and poison the disk cache), so a
+            # count mismatch is treated the same as any other batch failure.
+            if not isinstance(parsed, list) or len(parsed) != len(batch):
+                raise ValueError(
+                    f"expected {len(batch)} classifications, got "
+                    f"{len(parsed) if isinstance(parsed, list) else type(parsed).__name__}"
+                )
+
+            _GEMINI_TUNER.record(time.monotonic() - started, True)
+            return parsed
+
         except Exception as e:
+            _GEMINI_TUNER.record(time.monotonic() - started, False)
             logger.warning("Gemini batch failed: %s", e)
             # Fall back to rule-based for this batch
+            fallback = []
             for tool in batch:
                 result = apply_rules(tool, policy)
                 result["name"] = tool["name"]
-                results.append(result)
-    
+                fallback.append(result)
+            return fallback
+
+    # Preallocate at the known total so no resizes happen while batches
+    # land; _classify_batch always returns exactly len(batch) entries
+    # (mismatched model output falls back to rules), so every batch lands
+    # in its own slots and later batches stay aligned.
+    results: list[dict] = [None] * sum(len(batch) for batch in batches)
+    with ThreadPoolExecutor(max_workers=min(_GEMINI_CONCURRENCY, len(batches)) or 1) as pool:
+        pos = 0
+        for batch, batch_results in zip(
+            batches, pool.map(lambda pair: _classify_batch(*pair), enumerate(batches))
+        ):
+            results[pos:pos + len(batch)] = batch_results
+            pos += len(batch)
+
+    return results
+
+
+def _tool_fingerprint(tool: dict) -> str:
+    """Stable 8-byte fingerprint of a tool's identity (method|path|name)."""
+    key = f"{tool.get('method', '')}|{tool.get('path', '')}|{tool.get('name', '')}"
+    return hashlib.blake2b(key.encode(), digest_size=8).hexdigest()
+
+
+# Read-through disk cache for Gemini results: re-running the CLI on a
+# mostly-unchanged SDK should only pay for tools that actually changed.
+_CLASSIFY_CACHE_PATH = Path.home() / ".mcp_adapter" / "classify_cache.sqlite"
+
+
+def _content_fingerprint(tool: dict, policy: str) -> str:
+    """Fingerprint of the tool's full content plus policy — any change busts it."""
+    return hashlib.blake2b(
+        orjson.dumps(tool, option=orjson.OPT_SORT_KEYS) + policy.encode()
+    ).hexdigest()
+
+
+def _open_classify_cache() -> sqlite3.Connection | None:
+    """Open (creating if needed) the on-disk cache; None if unavailable."""
+    try:
+        _CLASSIFY_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(_CLASSIFY_CACHE_PATH)
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS classifications "
+            "(fingerprint TEXT PRIMARY KEY, result BLOB)"
+        )
+        return conn
+    except (sqlite3.Error, OSError) as e:
+        logger.warning("Classification cache unavailable: %s", e)
+        return None
+
+
+def _classify_with_gemini_deduped(
+    tools: list[dict], policy: PolicyType, use_cache: bool = True
+) -> list[dict]:
+    """Send only new, unique tools to Gemini and fan results back out.
+
+    Two layers of reuse before any tokens are spent: in-run dedup —
+    versioned SDK dumps often repeat the same method+path+name, so one
+    representative per group is classified and copied to its duplicates —
+    and a cross-run sqlite cache keyed by content fingerprint, so
+    unchanged tools from a previous invocation skip the API entirely.
+    """
+    groups: dict[str, list[int]] = defaultdict(list)
+    for i, tool in enumerate(tools):
+        groups[_tool_fingerprint(tool)].append(i)
+
+    if len(groups) < len(tools):
+        logger.info(
+            "Deduplicated %d tools to %d unique for Gemini (%.0f%% saved)",
+            len(tools), len(groups), 100.0 * (1 - len(groups) / len(tools)),
+        )
+
+    cache = _open_classify_cache() if use_cache else None
+    results: list[dict | None] = [None] * len(tools)
+    misses: list[tuple[dict, list[int], str]] = []
+    hits = 0
+
+    for members in groups.values():
+        tool = tools[members[0]]
+        fingerprint = _content_fingerprint(tool, policy)
+        cached = None
+        if cache is not None:
+            row = cache.execute(
+                "SELECT result FROM classifications WHERE fingerprint = ?",
+                (fingerprint,),
+            ).fetchone()
+            if row:
+                cached = orjson.loads(row[0])
+        if cached is not None:
+            hits += 1
+            for idx in members:
+                # Own dict per slot — reasoning enhancement mutates in place
+                results[idx] = dict(cached)
+        else:
+            misses.append((tool, members, fingerprint))
+
+    if hits:
+        logger.info("Classification cache: %d/%d unique tools served from disk", hits, len(groups))
+
+    if misses:
+        batch_results = classify_batch_with_gemini([m[0] for m in misses], policy)
+        for (tool, members, fingerprint), result in zip(misses, batch_results):
+            if not isinstance(result, dict):
+                continue  # backfilled below, and kept out of the cache
+            for idx in members:
+                results[idx] = dict(result)
+            if cache is not None:
+                cache.execute(
+                    "INSERT OR REPLACE INTO classifications VALUES (?, ?)",
+                    (fingerprint, orjson.dumps(result)),
+                )
+        if cache is not None:
+            cache.commit()
+
+    # Belt and braces: classify_batch_with_gemini should cover every tool,
+    # but any slot it somehow left empty gets a rule-based result rather
+    # than a None that would crash downstream consumers.
+    for i, result in enumerate(results):
+        if result is None:
+            fallback = apply_rules(tools[i], policy)
+            fallback["name"] = tools[i]["name"]
+            results[i] = fallback
+
+    if cache is not None:
+        cache.close()
     return results
 
 
@@ -291,18 +679,11 @@ def enhance_with_reasoning(
     model: str = "deepseek-ai/DeepSeek-R1"
 ) -> list[dict]:
     """Use Featherless (DeepSeek-R1) to reason about edge cases."""
-    from openai import OpenAI
-    
-    api_key = os.getenv("DEDALUS_API_KEY")
-    if not api_key:
+    client = _get_featherless_client()
+    if client is None:
         logger.warning("DEDALUS_API_KEY not set, skipping reasoning enhancement")
         return classifications
-    
-    client = OpenAI(
-        base_url="https://api.featherless.ai/v1",
-        api_key=api_key,
-    )
-    
+
     # Find edge cases (low confidence or needs review)
     edge_cases = []
     for i, (tool, classification) in enumerate(zip(tools, classifications)):
@@ -314,8 +695,13 @@ def enhance_with_reasoning(
         return classifications
     
     logger.info("Analyzing %d edge cases with %s", len(edge_cases), model)
-    
-    for idx, tool, current in edge_cases:
+
+    # Each DeepSeek-R1 call spends seconds on reasoning tokens; fan the
+    # edge cases out over a bounded pool so that latency overlaps, with
+    # the shared token bucket replacing the old 0.5s sleep per call.
+    limiter = _RateLimiter(_REASONING_REQUESTS_PER_MINUTE)
+
+    def _reason_one(idx: int, tool: dict, current: dict) -> None:
         prompt = f"""Analyze this API endpoint and determine if it should be exposed via MCP.
 
 Tool: {json.dumps(tool, indent=2)}
@@ -336,45 +722,94 @@ Respond with JSON only:
 {{"expose": true/false, "reason": "explanation", "confidence": 0.0-1.0}}"""
 
         try:
+            limiter.wait()
             response = client.chat.completions.create(
                 model=model,
                 messages=[{"role": "user", "content": prompt}],
                 max_tokens=500,
             )
-            
+
             result_text = response.choices[0].message.content.strip()
-            
+
             # Parse JSON from response
             if not result_text.startswith("{"):
                 start = result_text.find("{")
                 end = result_text.rfind("}") + 1
                 if start != -1 and end > start:
                     result_text = result_text[start:end]
-            
+
             result = json.loads(result_text)
-            
-            # Update classification
+
+            # Update classification (each worker owns its idx — no races)
             classifications[idx]["expose"] = result.get("expose", "review")
             classifications[idx]["reason"] = result.get("reason", current.get("reason"))
             classifications[idx]["confidence"] = result.get("confidence", 0.7)
             classifications[idx]["enhanced"] = True
-            
-            time.sleep(0.5)  # Rate limiting
-            
+
         except Exception as e:
             logger.warning("Reasoning failed for %s: %s", tool.get('name'), e)
-    
+
+    with ThreadPoolExecutor(max_workers=min(_REASONING_CONCURRENCY, len(edge_cases))) as pool:
+        for _ in pool.map(lambda case: _reason_one(*case), edge_cases):
+            pass
+
     return classifications
 
 
 # ── In-memory Classification (for API server use) ────────────────────────────
 
 
+def _apply_rules_batch(tools: list[dict], policy: PolicyType) -> list[dict]:
+    """Rule-classify a list of tools, building each result dict in one shot.
+
+    Normalizes fields exactly once per tool and feeds the cached core
+    directly — no intermediate dict that then gets a name patched in.
+    """
+    results = []
+    for tool in tools:
+        name = tool.get("name", "")
+        classification, expose, reason, confidence = _classify_normalized(
+            name.lower(),
+            tool.get("method", "").upper(),
+            tool.get("description", "").lower(),
+            tool.get("path", "").lower(),
+            policy,
+        )
+        results.append({
+            "classification": classification,
+            "expose": _EXPOSE_TO_JSON[expose],
+            "reason": reason,
+            "confidence": confidence,
+            "name": name,
+        })
+    return results
+
+
+def _summarize(classifications: list[dict]) -> dict:
+    """Tally expose decisions in a single pass over the list."""
+    exposable = blocked = review = 0
+    for c in classifications:
+        expose = c.get("expose")
+        if expose is True:
+            exposable += 1
+        elif expose is False:
+            blocked += 1
+        elif expose == "review":
+            review += 1
+    return {
+        "total": len(classifications),
+        "exposable": exposable,
+        "blocked": blocked,
+        "needs_review": review,
+    }
+
+
 def classify_tools(
     tools: list[dict],
     policy: PolicyType = "moderate",
     use_gemini: bool = False,
     use_reasoning: bool = False,
+    use_cache: bool = True,
 ) -> dict:
     """Classify a list of raw tool dicts in memory.
 
@@ -386,32 +821,21 @@ def classify_tools(
     logger.info("Classifying %d tools with '%s' policy", len(tools), policy)
 
     if use_gemini:
-        classifications = classify_batch_with_gemini(tools, policy)
+        classifications = _classify_with_gemini_deduped(tools, policy, use_cache=use_cache)
     else:
-        classifications = []
-        for tool in tools:
-            result = apply_rules(tool, policy)
-            result["name"] = tool.get("name", "")
-            classifications.append(result)
+        classifications = _apply_rules_batch(tools, policy)
 
     if use_reasoning:
         classifications = enhance_with_reasoning(tools, classifications)
 
-    exposable = sum(1 for c in classifications if c.get("expose") is True)
-    blocked = sum(1 for c in classifications if c.get("expose") is False)
-    review = sum(1 for c in classifications if c.get("expose") == "review")
+    summary = _summarize(classifications)
 
     logger.info("Classification complete — Total: %d, Exposable: %d, Blocked: %d, Review: %d",
-                len(tools), exposable, blocked, review)
+                summary["total"], summary["exposable"], summary["blocked"], summary["needs_review"])
 
     return {
         "policy": policy,
-        "summary": {
-            "total": len(tools),
-            "exposable": exposable,
-            "blocked": blocked,
-            "needs_review": review,
-        },
+        "summary": summary,
         "classifications": classifications,
     }
 
@@ -425,11 +849,12 @@ def classify(
     policy: PolicyType = "moderate",
     use_gemini: bool = True,
     use_reasoning: bool = False,
+    use_cache: bool = True,
 ) -> dict:
     """Main classification function."""
     
     # Load input
-    input_data = json.loads(Path(input_path).read_text(encoding="utf-8"))
+    input_data = orjson.loads(Path(input_path).read_bytes())
     tools = input_data.get("tools", [])
     
     if not tools:
@@ -439,45 +864,31 @@ def classify(
     
     # Classify
     if use_gemini:
-        classifications = classify_batch_with_gemini(tools, policy)
+        classifications = _classify_with_gemini_deduped(tools, policy, use_cache=use_cache)
     else:
-        classifications = []
-        for tool in tools:
-            result = apply_rules(tool, policy)
-            result["name"] = tool["name"]
-            classifications.append(result)
+        classifications = _apply_rules_batch(tools, policy)
     
     # Enhance edge cases with reasoning
     if use_reasoning:
         classifications = enhance_with_reasoning(tools, classifications)
     
     # Build output
-    exposable = sum(1 for c in classifications if c.get("expose") == True)
-    blocked = sum(1 for c in classifications if c.get("expose") == False)
-    review = sum(1 for c in classifications if c.get("expose") == "review")
-    
+    summary = _summarize(classifications)
+
     result = {
         "source": input_data.get("source", input_path),
         "policy": policy,
-        "summary": {
-            "total": len(tools),
-            "exposable": exposable,
-            "blocked": blocked,
-            "needs_review": review,
-        },
+        "summary": summary,
         "classifications": classifications,
     }
     
     # Write output if path given
     if output_path:
-        Path(output_path).write_text(
-            json.dumps(result, indent=2, ensure_ascii=False),
-            encoding="utf-8"
-        )
+        Path(output_path).write_bytes(orjson.dumps(result, option=orjson.OPT_INDENT_2))
     
     logger.info("Classification complete — Total: %d, Exposable: %d, Blocked: %d, Review: %d",
-                len(tools), exposable, blocked, review)
-    
+                summary["total"], summary["exposable"], summary["blocked"], summary["needs_review"])
+
     return result
 
 
@@ -512,9 +923,14 @@ def main():
         action="store_true",
         help="Use Featherless (DeepSeek-R1) for edge case reasoning",
     )
-    
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Skip the on-disk classification cache (force fresh Gemini calls)",
+    )
+
     args = parser.parse_args()
-    
+
     try:
         classify(
             input_path=args.input,
@@ -522,6 +938,7 @@ def main():
             policy=args.policy,
             use_gemini=not args.no_gemini,
             use_reasoning=args.use_reasoning,
+            use_cache=not args.no_cache,
         )
     except Exception as e:
         print(f"[ERROR] Classification failed: {e}")
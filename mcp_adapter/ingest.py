@@ -13,14 +13,28 @@ Future:
 
 from __future__ import annotations
 
+import asyncio
+import atexit
+import hashlib
 import json
+import os
+import pickle
+import re
+import threading
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable
 from urllib.parse import urlparse
 
 import httpx
+import orjson
 import yaml
 
+try:  # libyaml's C loader parses 3-10x faster when available
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 from .logger import get_logger, log_stage
 from .models import (
     APISpec,
@@ -35,99 +49,241 @@ from .models import (
 
 # ── Helpers ─────────────────────────────────────────────────────────────────
 
+# Swagger UI embeds its spec location as `url: "..."` (or `url = "..."`)
+# in the page's JS config; compiled once instead of per HTML fallback
+_SWAGGER_URL_RE = re.compile(r'''url\s*[:=]\s*["']([^"']+)["']''')
+
+# One C-level scan to screen candidates instead of a Python any() loop
+_SPEC_KW_RE = re.compile(r"swagger|openapi|api-docs|\.json|\.yaml", re.I)
+
+# Operation keys recognised in a path item, with the enum precomputed so
+# the endpoint loop does a dict lookup instead of an enum construction
+_HTTP_METHODS = frozenset({"get", "post", "put", "patch", "delete", "head", "options"})
+_METHOD_ENUM = {m: HttpMethod(m.upper()) for m in _HTTP_METHODS}
+
+# Enum members by wire value — a dict hit skips the enum __call__ /
+# _missing_ machinery that every ParamSchema and Endpoint paid for
+_METHOD_BY_VALUE = {m.value: m for m in HttpMethod}
+_LOC_MAP = {loc.value: loc for loc in ParamLocation}
+
+# Python scalar type → JSON schema type name, for inferring body-field
+# types from Postman raw-body examples with one dict lookup
+_PY_TO_JSON = {
+    str: "string",
+    int: "integer",
+    float: "number",
+    bool: "boolean",
+    type(None): "null",
+}
+
+# Parsed-spec cache keyed by content hash: unchanged spec bytes skip the
+# whole parse and come back as a pickle load. Lives under the per-user
+# ~/.mcp_adapter dir like the other caches — pickle must never be loaded
+# from a world-writable location. MCP_ADAPTER_NO_CACHE=1 disables it
+# (CI, or when debugging the parser itself).
+_CACHE_DIR = Path.home() / ".mcp_adapter" / "spec_cache"
+
+
+def _spec_cache_key(raw_bytes: bytes) -> str:
+    return hashlib.blake2b(raw_bytes, digest_size=16).hexdigest()
+
+
+def _spec_cache_load(key: str) -> APISpec | None:
+    if os.getenv("MCP_ADAPTER_NO_CACHE"):
+        return None
+    try:
+        return pickle.loads((_CACHE_DIR / f"{key}.pkl").read_bytes())
+    except FileNotFoundError:
+        return None
+    except Exception:  # stale format, truncated write, … — just re-parse
+        return None
+
+
+def _spec_cache_store(key: str, spec: APISpec) -> None:
+    if os.getenv("MCP_ADAPTER_NO_CACHE"):
+        return
+    try:
+        _CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp = _CACHE_DIR / f".{key}.{os.getpid()}.tmp"
+        tmp.write_bytes(pickle.dumps(spec, protocol=pickle.HIGHEST_PROTOCOL))
+        os.replace(tmp, _CACHE_DIR / f"{key}.pkl")
+    except OSError:
+        pass
+
+
+_http_client: httpx.Client | None = None
+_http_client_lock = threading.Lock()
+
 
-def _is_url(source: str) -> bool:
-    """Check if source is a URL."""
+def _get_http_client() -> httpx.Client:
+    """Lazy module-level HTTP client so repeated fetches reuse connections.
+
+    A fresh client per call re-ran the TLS handshake for every request;
+    the shared pool keeps connections alive across ingest() calls.
+    Closed at interpreter exit.
+    """
+    global _http_client
+    if _http_client is None:
+        with _http_client_lock:
+            if _http_client is None:
+                _http_client = httpx.Client(
+                    timeout=30.0,
+                    follow_redirects=True,
+                    limits=httpx.Limits(max_keepalive_connections=10),
+                )
+                atexit.register(_http_client.close)
+    return _http_client
+
+
+def _parse_if_url(source: str):
+    """Return the urlparse result if source is an http(s) URL, else None.
+
+    The caller passes the parsed result on to _fetch_url so the URL is
+    split exactly once per ingest.
+    """
     try:
         parsed = urlparse(str(source))
-        return parsed.scheme in ("http", "https")
+        return parsed if parsed.scheme in ("http", "https") else None
     except Exception:
-        return False
+        return None
 
 
-def _fetch_url(url: str) -> dict[str, Any]:
+async def _probe_candidates(spec_urls: list[str]) -> tuple[str, dict] | None:
+    """Probe candidate spec URLs concurrently; first valid spec wins.
+
+    All but one candidate will usually 404, so paying a full RTT for
+    each in series is pure latency. A semaphore bounds in-flight
+    requests; remaining probes are cancelled once a winner parses.
+    """
+    logger = get_logger()
+    semaphore = asyncio.Semaphore(5)
+
+    async with httpx.AsyncClient(timeout=30.0, follow_redirects=True) as client:
+
+        async def _probe(spec_url: str) -> tuple[str, dict] | None:
+            async with semaphore:
+                logger.info("Trying spec URL: %s", spec_url)
+                resp = await client.get(spec_url, headers={"Accept": "application/json"})
+                if resp.status_code != 200:
+                    return None
+                try:
+                    data = orjson.loads(resp.content)
+                except (json.JSONDecodeError, ValueError):
+                    return None
+                if isinstance(data, dict) and ("openapi" in data or "swagger" in data):
+                    return spec_url, data
+                return None
+
+        tasks = [asyncio.create_task(_probe(u)) for u in spec_urls]
+        try:
+            for future in asyncio.as_completed(tasks):
+                try:
+                    found = await future
+                except Exception:
+                    continue
+                if found is not None:
+                    return found
+        finally:
+            for task in tasks:
+                task.cancel()
+    return None
+
+
+def _fetch_url(url: str, parsed=None) -> dict[str, Any]:
     """Fetch an OpenAPI spec from a URL (JSON or YAML).
 
     If the URL points to a Swagger UI HTML page, auto-discover the actual
-    spec URL by parsing the page or trying common patterns.
+    spec URL by parsing the page or trying common patterns. Callers that
+    already split the URL pass `parsed` to avoid a second urlparse.
     """
-    import re
-
     logger = get_logger()
+    if parsed is None:
+        parsed = urlparse(url)
     logger.info("Fetching spec from URL: %s", url)
-    with httpx.Client(timeout=30.0, follow_redirects=True) as client:
-        resp = client.get(url, headers={"Accept": "application/json, application/yaml, */*"})
-        resp.raise_for_status()
-        content_type = resp.headers.get("content-type", "")
-        text = resp.text
-        logger.debug("Fetched %d bytes (content-type: %s)", len(text), content_type)
-
-        # Try JSON first, fall back to YAML
+    resp = _get_http_client().get(
+        url, headers={"Accept": "application/json, application/yaml, */*"}
+    )
+    resp.raise_for_status()
+    content_type = resp.headers.get("content-type", "")
+    raw_body = resp.content
+    logger.debug("Fetched %d bytes (content-type: %s)", len(raw_body), content_type)
+
+    # Parse straight from bytes — orjson and libyaml both take them,
+    # so the str decode only happens if we fall through to the HTML
+    # path. A one-byte sniff skips the JSON attempt for YAML/HTML.
+    if raw_body.lstrip()[:1] in (b"{", b"["):
         try:
-            data = json.loads(text)
+            data = orjson.loads(raw_body)
             if isinstance(data, dict):
                 return data
         except (json.JSONDecodeError, ValueError):
             pass
 
-        # Check if YAML produces a dict
-        try:
-            data = yaml.safe_load(text)
-            if isinstance(data, dict):
-                return data
-        except Exception:
-            pass
+    # Check if YAML produces a dict
+    try:
+        data = yaml.load(raw_body, Loader=_YamlLoader)
+        if isinstance(data, dict):
+            return data
+    except Exception:
+        pass
+
+    # A URL that names the spec file directly can't be a Swagger UI
+    # page — if it didn't parse, probing siblings won't help
+    if parsed.path.endswith((".json", ".yaml", ".yml")):
+        raise ValueError(
+            f"Content at {url} is not a valid OpenAPI/Swagger spec"
+        )
+
+    # If we got here, the response is likely HTML (Swagger UI page).
+    # Try to extract the spec URL from the page content.
+    logger.info("Response looks like HTML, attempting to discover spec URL...")
+    text = resp.text
+    base = f"{parsed.scheme}://{parsed.netloc}"
+
+    # Look for spec URL in Swagger UI HTML (e.g. url: "/v2/swagger.json")
+    spec_url_candidates: list[str] = []
+
+    # Pattern: url: "..." or url : "..." in Swagger UI JS config
+    for match in _SWAGGER_URL_RE.findall(text):
+        if _SPEC_KW_RE.search(match):
+            spec_url_candidates.append(match)
+
+    # Common fallback patterns, most likely first: regex hits above are
+    # high-signal, then plain /openapi.json, then framework-specific ones
+    path_base = parsed.path.rstrip("/")
+    spec_url_candidates.extend([
+        f"{path_base}/openapi.json",
+        f"{path_base}/v3/api-docs",
+        f"{path_base}/swagger.json",
+        f"{path_base}/v2/swagger.json",
+        "/openapi.json",
+        "/v3/api-docs",
+        "/swagger.json",
+        "/v2/swagger.json",
+        "/api/openapi.json",
+    ])
+
+    # Resolve relative URLs, dropping duplicates (an empty path_base
+    # makes every path-relative pattern collide with its root variant)
+    seen: set[str] = set()
+    resolved_urls: list[str] = []
+    for candidate in spec_url_candidates:
+        if candidate.startswith("http"):
+            resolved = candidate
+        elif candidate.startswith("/"):
+            resolved = base + candidate
+        else:
+            resolved = base + "/" + candidate
+        if resolved not in seen:
+            seen.add(resolved)
+            resolved_urls.append(resolved)
+
+    found = asyncio.run(_probe_candidates(resolved_urls))
+    if found is not None:
+        spec_url, data = found
+        logger.info("Found valid spec at %s", spec_url)
+        return data
 
-        # If we got here, the response is likely HTML (Swagger UI page).
-        # Try to extract the spec URL from the page content.
-        logger.info("Response looks like HTML, attempting to discover spec URL...")
-        parsed = urlparse(url)
-        base = f"{parsed.scheme}://{parsed.netloc}"
-
-        # Look for spec URL in Swagger UI HTML (e.g. url: "/v2/swagger.json")
-        spec_url_candidates: list[str] = []
-
-        # Pattern: url: "..." or url : "..." in Swagger UI JS config
-        for match in re.findall(r'''url\s*[:=]\s*["']([^"']+)["']''', text):
-            if any(kw in match.lower() for kw in ("swagger", "openapi", "api-docs", ".json", ".yaml")):
-                spec_url_candidates.append(match)
-
-        # Common fallback patterns
-        path_base = parsed.path.rstrip("/")
-        spec_url_candidates.extend([
-            f"{path_base}/v2/swagger.json",
-            f"{path_base}/v3/api-docs",
-            f"{path_base}/swagger.json",
-            f"{path_base}/openapi.json",
-            "/v2/swagger.json",
-            "/v3/api-docs",
-            "/openapi.json",
-            "/swagger.json",
-            "/api/openapi.json",
-        ])
-
-        for candidate in spec_url_candidates:
-            # Resolve relative URLs
-            if candidate.startswith("http"):
-                spec_url = candidate
-            elif candidate.startswith("/"):
-                spec_url = base + candidate
-            else:
-                spec_url = base + "/" + candidate
-
-            logger.info("Trying spec URL: %s", spec_url)
-            try:
-                r = client.get(spec_url, headers={"Accept": "application/json"})
-                if r.status_code == 200:
-                    try:
-                        data = json.loads(r.text)
-                        if isinstance(data, dict) and ("openapi" in data or "swagger" in data):
-                            logger.info("Found valid spec at %s", spec_url)
-                            return data
-                    except (json.JSONDecodeError, ValueError):
-                        pass
-            except Exception:
-                continue
 
     raise ValueError(
         f"Could not find an OpenAPI/Swagger spec at {url}. "
@@ -141,123 +297,198 @@ def _load_file(path: str | Path) -> dict[str, Any]:
     path = Path(path)
     text = path.read_text(encoding="utf-8")
     if path.suffix in {".yaml", ".yml"}:
-        return yaml.safe_load(text)
-    return json.loads(text)
+        return yaml.load(text, Loader=_YamlLoader)
+    return orjson.loads(text)
 
 
-def _resolve_ref(spec: dict, ref: str) -> dict:
-    """Resolve a simple $ref like '#/components/schemas/Pet'."""
-    parts = ref.lstrip("#/").split("/")
+def _resolve_ref(spec: dict, ref: str, cache: dict[str, dict] | None = None) -> dict:
+    """Resolve a simple $ref like '#/components/schemas/Pet'.
+
+    With a cache (one per parse), each distinct ref string is walked once
+    no matter how many operations reference it.
+    """
+    if cache is not None:
+        node = cache.get(ref)
+        if node is not None:
+            return node
     node = spec
-    for p in parts:
+    for p in ref.lstrip("#/").split("/"):
         node = node.get(p, {})
+    if cache is not None:
+        cache[ref] = node
     return node
 
 
-def _flatten_schema(spec: dict, schema: dict) -> dict:
-    """Recursively resolve $ref in a schema dict."""
-    if "$ref" in schema:
-        schema = _resolve_ref(spec, schema["$ref"])
-    result = dict(schema)
-    if "properties" in result:
-        result["properties"] = {
-            k: _flatten_schema(spec, v)
-            for k, v in result["properties"].items()
-        }
-    if "items" in result:
-        result["items"] = _flatten_schema(spec, result["items"])
-    if "allOf" in result:
-        merged: dict[str, Any] = {}
-        for sub in result["allOf"]:
-            sub = _flatten_schema(spec, sub)
-            merged.update(sub)
-            if "properties" in sub:
-                merged.setdefault("properties", {}).update(sub["properties"])
-        result = merged
-    return result
+def _flatten_schema(
+    spec: dict,
+    schema: dict,
+    memo: dict[int, dict] | None = None,
+    refs: dict[str, dict] | None = None,
+) -> dict:
+    """Resolve $ref in a schema dict, iteratively.
+
+    memo caches flattened results by id() of the input node — safe
+    because the spec dict is never mutated — so a shared schema (a `Pet`
+    referenced by dozens of endpoints) is flattened once per parse. The
+    memo doubles as the cycle guard: a node seen again while still being
+    flattened comes back unexpanded instead of looping forever.
+
+    An explicit stack replaces recursion: no Python frame per schema
+    node, and deep allOf/properties nesting can't hit RecursionError.
+    Each node is visited twice — once to expand refs and queue its
+    children, once (after the children resolved) to run the allOf merge
+    and write the result into its parent slot.
+    """
+    holder: list[Any] = [None]
+    # (expanded, node_or_result, parent, key, memo_key)
+    stack: list[tuple] = [(False, schema, holder, 0, 0)]
+    while stack:
+        expanded, node, parent, key, nkey = stack.pop()
+
+        if expanded:
+            result = node
+            if "allOf" in result:
+                # Subs are flattened by now; the merged dict replaces the
+                # node wholesale, matching the recursive behaviour
+                merged: dict[str, Any] = {}
+                for sub in result["allOf"]:
+                    merged.update(sub)
+                    if "properties" in sub:
+                        merged.setdefault("properties", {}).update(sub["properties"])
+                result = merged
+            if memo is not None:
+                memo[nkey] = result
+            parent[key] = result
+            continue
+
+        if "$ref" in node:
+            node = _resolve_ref(spec, node["$ref"], refs)
+        if "properties" not in node and "items" not in node and "allOf" not in node:
+            # Leaf with nothing to expand — keep the node itself instead
+            # of copying; flattened schemas are read-only by contract
+            parent[key] = node
+            continue
+        nkey = id(node)
+        if memo is not None:
+            cached = memo.get(nkey)
+            if cached is not None:
+                parent[key] = cached
+                continue
+            memo[nkey] = node  # placeholder: self-references stop here
+
+        result = dict(node)
+        children: list[tuple] = []
+        if "properties" in result:
+            props = dict(result["properties"])
+            result["properties"] = props
+            for k, v in props.items():
+                children.append((False, v, props, k, 0))
+        if "items" in result:
+            children.append((False, result["items"], result, "items", 0))
+        if "allOf" in result:
+            subs = list(result["allOf"])
+            result["allOf"] = subs
+            for i, sub in enumerate(subs):
+                children.append((False, sub, subs, i, 0))
+        # Second visit lands after all children; reversing keeps the
+        # children processing in declaration order
+        stack.append((True, result, parent, key, nkey))
+        stack.extend(reversed(children))
+    return holder[0]
 
 
 # ── OpenAPI 3.x / Swagger 2.x ──────────────────────────────────────────────
 
 
 def _parse_openapi_params(
-    spec: dict, raw_params: list[dict]
+    spec: dict, raw_params: list[dict], refs: dict[str, dict] | None = None
 ) -> list[ParamSchema]:
     params: list[ParamSchema] = []
     for p in raw_params:
         if "$ref" in p:
-            p = _resolve_ref(spec, p["$ref"])
-        schema = p.get("schema", {})
+            p = _resolve_ref(spec, p["$ref"], refs)
+        # Bind .get once per dict — each lookup below is then a plain
+        # local call instead of an attribute walk
+        _get = p.get
+        schema = _get("schema", {})
         if "$ref" in schema:
-            schema = _resolve_ref(spec, schema["$ref"])
+            schema = _resolve_ref(spec, schema["$ref"], refs)
+        _sget = schema.get
         params.append(
-            ParamSchema(
-                name=p.get("name", ""),
-                location=ParamLocation(p.get("in", "query")),
-                description=p.get("description", ""),
-                required=p.get("required", False),
-                schema_type=schema.get("type", "string"),
-                enum=schema.get("enum"),
-                default=schema.get("default"),
-                example=p.get("example") or schema.get("example"),
+            ParamSchema.model_construct(
+                name=_get("name", ""),
+                location=_LOC_MAP.get(_get("in", "query"), ParamLocation.QUERY),
+                description=_get("description", ""),
+                required=_get("required", False),
+                schema_type=_sget("type", "string"),
+                enum=_sget("enum"),
+                default=_sget("default"),
+                example=_get("example") or _sget("example"),
             )
         )
     return params
 
 
 def _parse_openapi_request_body(
-    spec: dict, body: dict | None
+    spec: dict,
+    body: dict | None,
+    memo: dict[int, dict] | None = None,
+    refs: dict[str, dict] | None = None,
 ) -> tuple[dict[str, Any], list[ParamSchema]]:
     """Return (raw_schema_dict, body_params_as_ParamSchema list)."""
     if not body:
         return {}, []
     if "$ref" in body:
-        body = _resolve_ref(spec, body["$ref"])
+        body = _resolve_ref(spec, body["$ref"], refs)
     content = body.get("content", {})
     json_content = content.get("application/json", {})
     schema = json_content.get("schema", {})
-    schema = _flatten_schema(spec, schema)
+    schema = _flatten_schema(spec, schema, memo, refs)
 
     params: list[ParamSchema] = []
     required_fields = set(schema.get("required", []))
     for name, prop in schema.get("properties", {}).items():
-        prop = _flatten_schema(spec, prop)
+        prop = _flatten_schema(spec, prop, memo, refs)
+        _pget = prop.get
         params.append(
-            ParamSchema(
+            ParamSchema.model_construct(
                 name=name,
                 location=ParamLocation.BODY,
-                description=prop.get("description", ""),
+                description=_pget("description", ""),
                 required=name in required_fields,
-                schema_type=prop.get("type", "string"),
-                enum=prop.get("enum"),
-                default=prop.get("default"),
-                example=prop.get("example"),
+                schema_type=_pget("type", "string"),
+                enum=_pget("enum"),
+                default=_pget("default"),
+                example=_pget("example"),
             )
         )
     return schema, params
 
 
 def _parse_openapi_responses(
-    spec: dict, raw: dict
+    spec: dict,
+    raw: dict,
+    memo: dict[int, dict] | None = None,
+    refs: dict[str, dict] | None = None,
 ) -> list[ResponseSchema]:
     responses: list[ResponseSchema] = []
     for code, resp in raw.items():
         if "$ref" in resp:
-            resp = _resolve_ref(spec, resp["$ref"])
+            resp = _resolve_ref(spec, resp["$ref"], refs)
         content = resp.get("content", {})
         schema: dict[str, Any] = {}
         ct = "application/json"
         if content:
             ct = next(iter(content))
-            schema = _flatten_schema(
-                spec, content[ct].get("schema", {})
-            )
+            raw_schema = content[ct].get("schema")
+            if raw_schema:
+                schema = _flatten_schema(spec, raw_schema, memo, refs)
         try:
             status = int(code)
         except ValueError:
             status = 0
         responses.append(
-            ResponseSchema(
+            ResponseSchema.model_construct(
                 status_code=status,
                 description=resp.get("description", ""),
                 content_type=ct,
@@ -276,7 +507,7 @@ def _extract_auth_schemes(spec: dict) -> list[AuthScheme]:
     )
     for name, defn in defs.items():
         schemes.append(
-            AuthScheme(
+            AuthScheme.model_construct(
                 name=name,
                 scheme_type=defn.get("type", ""),
                 location=defn.get("in", ""),
@@ -293,6 +524,11 @@ def parse_openapi(source: str | Path, raw_data: dict | None = None) -> APISpec:
     Args:
         source: File path or URL.
         raw_data: Pre-loaded spec dict (skips file/URL loading).
+
+    Model instances are built with model_construct: the parser owns the
+    shape of every field it passes, so per-object Pydantic validation is
+    skipped. Anything feeding dicts in from elsewhere must keep that
+    contract.
     """
     logger = get_logger()
     raw = raw_data if raw_data is not None else _load_file(source)
@@ -319,37 +555,52 @@ def parse_openapi(source: str | Path, raw_data: dict | None = None) -> APISpec:
     endpoints: list[Endpoint] = []
     all_tags: set[str] = set()
 
+    # Per-parse caches shared by every operation: resolved refs by ref
+    # string, flattened schemas by node identity
+    refs: dict[str, dict] = {}
+    memo: dict[int, dict] = {}
+    # Specs tag hundreds of endpoints with the same one or two tags;
+    # intern the list per unique tuple so they all share one object
+    tag_interner: dict[tuple[str, ...], list[str]] = {}
+
     for path_str, path_item in raw.get("paths", {}).items():
         if not isinstance(path_item, dict):
             continue
         # Shared params at path level
         shared_params = path_item.get("parameters", [])
-        for method_str in ("get", "post", "put", "patch", "delete", "head", "options"):
-            operation = path_item.get(method_str)
-            if not operation:
+        # One pass over the keys actually present beats probing all
+        # seven methods per path (most path items hold one or two)
+        for method_str, operation in path_item.items():
+            if method_str not in _HTTP_METHODS or not isinstance(operation, dict):
                 continue
             op_params = shared_params + operation.get("parameters", [])
-            params = _parse_openapi_params(raw, op_params)
+            params = _parse_openapi_params(raw, op_params, refs)
 
             body_schema, body_params = _parse_openapi_request_body(
-                raw, operation.get("requestBody")
+                raw, operation.get("requestBody"), memo, refs
             )
             params.extend(body_params)
 
             responses = _parse_openapi_responses(
-                raw, operation.get("responses", {})
+                raw, operation.get("responses", {}), memo, refs
             )
 
-            tags = operation.get("tags", [])
-            all_tags.update(tags)
+            t_key = tuple(operation.get("tags", ()))
+            tags = tag_interner.setdefault(t_key, list(t_key))
+            all_tags.update(t_key)
 
-            # Per-operation security overrides global
-            op_security = operation.get("security", global_security)
-            op_auth = [n for sec in op_security for n in sec.keys()]
+            # Per-operation security overrides global; the default case
+            # shares one precomputed list across all endpoints instead of
+            # rebuilding the same names per operation
+            op_security = operation.get("security")
+            if op_security is None:
+                op_auth = global_auth_names
+            else:
+                op_auth = [n for sec in op_security for n in sec.keys()]
 
             endpoints.append(
-                Endpoint(
-                    method=HttpMethod(method_str.upper()),
+                Endpoint.model_construct(
+                    method=_METHOD_ENUM[method_str],
                     path=path_str,
                     operation_id=operation.get("operationId", ""),
                     summary=operation.get("summary", ""),
@@ -386,7 +637,8 @@ def parse_openapi(source: str | Path, raw_data: dict | None = None) -> APISpec:
 
 def _postman_method(item: dict) -> HttpMethod:
     req = item.get("request", {})
-    return HttpMethod(req.get("method", "GET").upper())
+    method = req.get("method", "GET").upper()
+    return _METHOD_BY_VALUE.get(method) or HttpMethod(method)
 
 
 def _postman_url(item: dict) -> tuple[str, str]:
@@ -411,7 +663,7 @@ def _postman_params(item: dict) -> list[ParamSchema]:
     if isinstance(url, dict):
         for q in url.get("query", []):
             params.append(
-                ParamSchema(
+                ParamSchema.model_construct(
                     name=q.get("key", ""),
                     location=ParamLocation.QUERY,
                     description=q.get("description", ""),
@@ -424,7 +676,7 @@ def _postman_params(item: dict) -> list[ParamSchema]:
         if h.get("key", "").lower() in ("content-type", "accept"):
             continue
         params.append(
-            ParamSchema(
+            ParamSchema.model_construct(
                 name=h.get("key", ""),
                 location=ParamLocation.HEADER,
                 description=h.get("description", ""),
@@ -436,18 +688,16 @@ def _postman_params(item: dict) -> list[ParamSchema]:
     body = req.get("body", {})
     if body.get("mode") == "raw":
         try:
-            raw_json = json.loads(body.get("raw", "{}"))
+            raw_json = orjson.loads(body.get("raw", "{}"))
             if isinstance(raw_json, dict):
                 for k, v in raw_json.items():
                     params.append(
-                        ParamSchema(
+                        ParamSchema.model_construct(
                             name=k,
                             location=ParamLocation.BODY,
                             description="",
                             required=True,
-                            schema_type=type(v).__name__
-                            if not isinstance(v, (dict, list))
-                            else "object",
+                            schema_type=_PY_TO_JSON.get(type(v), "object"),
                         )
                     )
         except (json.JSONDecodeError, TypeError):
@@ -458,22 +708,29 @@ def _postman_params(item: dict) -> list[ParamSchema]:
 def _walk_postman_items(
     items: list[dict], tag_prefix: str = ""
 ) -> list[Endpoint]:
-    """Recursively walk Postman item tree (folders = tags)."""
+    """Walk the Postman item tree (folders = tags) with an explicit stack.
+
+    Real collections nest folders several levels deep; the flat loop
+    avoids a Python call per folder and can't hit RecursionError. The
+    stack holds iterators so endpoints keep their declaration order —
+    a folder's contents are emitted before its later siblings, exactly
+    as the recursive version did.
+    """
     endpoints: list[Endpoint] = []
-    for item in items:
-        if "item" in item:
-            # It's a folder
-            folder_name = item.get("name", "")
-            endpoints.extend(
-                _walk_postman_items(item["item"], folder_name)
-            )
-        else:
+    stack = [(iter(items), tag_prefix)]
+    while stack:
+        it, tag_prefix = stack[-1]
+        for item in it:
+            if "item" in item:
+                # It's a folder — descend before finishing this level
+                stack.append((iter(item["item"]), item.get("name", "")))
+                break
             base, path = _postman_url(item)
             method = _postman_method(item)
             params = _postman_params(item)
             tags = [tag_prefix] if tag_prefix else []
             endpoints.append(
-                Endpoint(
+                Endpoint.model_construct(
                     method=method,
                     path=path,
                     operation_id="",
@@ -485,12 +742,14 @@ def _walk_postman_items(
                     parameters=params,
                 )
             )
+        else:
+            stack.pop()
     return endpoints
 
 
-def parse_postman(path: str | Path) -> APISpec:
+def parse_postman(path: str | Path, raw_data: dict | None = None) -> APISpec:
     """Parse a Postman Collection v2.1 JSON file."""
-    raw = _load_file(path)
+    raw = raw_data if raw_data is not None else _load_file(path)
     info = raw.get("info", {})
     endpoints = _walk_postman_items(raw.get("item", []))
 
@@ -518,18 +777,40 @@ def parse_postman(path: str | Path) -> APISpec:
 # ── Dispatcher ──────────────────────────────────────────────────────────────
 
 
-def ingest(source: str | Path) -> APISpec:
+def ingest(source: str | Path | bytes) -> APISpec:
     """Auto-detect format and parse into an APISpec.
 
-    Accepts a local file path OR a URL (http/https) to a Swagger/OpenAPI spec.
+    Accepts a local file path, a URL (http/https) to a Swagger/OpenAPI spec,
+    OR raw spec bytes (e.g. an uploaded file body) parsed fully in memory.
     """
     with log_stage("Ingestion") as logger:
+        # In-memory bytes (uploads) — no tempfile roundtrip needed
+        if isinstance(source, (bytes, bytearray)):
+            logger.info("Source is in-memory bytes (%d bytes)", len(source))
+            key = _spec_cache_key(bytes(source))
+            cached = _spec_cache_load(key)
+            if cached is not None:
+                logger.info("Parsed-spec cache hit")
+                return cached
+            data = yaml.load(source, Loader=_YamlLoader)
+            if not isinstance(data, dict):
+                raise ValueError("Uploaded spec did not parse to a mapping")
+            if "info" in data and "_postman_id" in data.get("info", {}):
+                spec = parse_postman("<upload>", raw_data=data)
+            elif "item" in data and "openapi" not in data and "swagger" not in data:
+                spec = parse_postman("<upload>", raw_data=data)
+            else:
+                spec = parse_openapi("<upload>", raw_data=data)
+            _spec_cache_store(key, spec)
+            return spec
+
         source_str = str(source)
 
         # URL-based fetching
-        if _is_url(source_str):
+        parsed_url = _parse_if_url(source_str)
+        if parsed_url is not None:
             logger.info("Source is a URL: %s", source_str)
-            data = _fetch_url(source_str)
+            data = _fetch_url(source_str, parsed_url)
             if "openapi" in data or "swagger" in data:
                 return parse_openapi(source_str, raw_data=data)
             logger.warning("URL content doesn't look like OpenAPI, trying anyway")
@@ -537,11 +818,37 @@ def ingest(source: str | Path) -> APISpec:
 
         # Local file
         logger.info("Source is a local file: %s", source_str)
+        key = _spec_cache_key(Path(source).read_bytes())
+        cached = _spec_cache_load(key)
+        if cached is not None:
+            logger.info("Parsed-spec cache hit")
+            return cached
         data = _load_file(source)
         if "openapi" in data or "swagger" in data:
-            return parse_openapi(source)
-        if "info" in data and "_postman_id" in data.get("info", {}):
-            return parse_postman(source)
-        if "item" in data:
-            return parse_postman(source)
-        return parse_openapi(source)
+            spec = parse_openapi(source, raw_data=data)
+        elif "info" in data and "_postman_id" in data.get("info", {}):
+            spec = parse_postman(source, raw_data=data)
+        elif "item" in data:
+            spec = parse_postman(source, raw_data=data)
+        else:
+            spec = parse_openapi(source, raw_data=data)
+        _spec_cache_store(key, spec)
+        return spec
+
+
+def ingest_many(
+    sources: Iterable[str | Path],
+    max_workers: int | None = None,
+) -> list[APISpec]:
+    """Parse several spec sources in parallel worker processes.
+
+    Parsing is CPU-bound (YAML/JSON decode plus model construction), so
+    threads gain nothing; processes do. APISpec pickles cleanly across
+    the process boundary, and sources already in the parsed-spec cache
+    short-circuit inside the worker without re-parsing.
+    """
+    sources = list(sources)
+    if len(sources) <= 1:
+        return [ingest(s) for s in sources]
+    with ProcessPoolExecutor(max_workers=max_workers or os.cpu_count()) as pool:
+        return list(pool.map(ingest, sources, chunksize=4))
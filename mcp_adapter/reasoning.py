@@ -78,39 +78,41 @@ def _call_llm(system_prompt: str, user_prompt: str, max_tokens: int = 2048) -> s
         )
 
     last_error: Exception | None = None
-    for provider in providers:
-        headers = {
-            "Authorization": f"Bearer {provider['api_key']}",
-            "Content-Type": "application/json",
-        }
-        payload = {
-            "model": provider["model"],
-            "messages": [
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": user_prompt},
-            ],
-            "max_tokens": max_tokens,
-            "temperature": 0.2,
-        }
-        url = f"{provider['base_url']}/chat/completions"
-        logger.info(
-            "Trying provider: %s (model=%s)", provider["name"], provider["model"],
-        )
-
-        try:
-            with httpx.Client(timeout=30.0) as client:
+    # One client across provider attempts — a fallback shouldn't pay for a
+    # fresh connection pool on top of the failed call it is retrying after
+    with httpx.Client(timeout=30.0) as client:
+        for provider in providers:
+            headers = {
+                "Authorization": f"Bearer {provider['api_key']}",
+                "Content-Type": "application/json",
+            }
+            payload = {
+                "model": provider["model"],
+                "messages": [
+                    {"role": "system", "content": system_prompt},
+                    {"role": "user", "content": user_prompt},
+                ],
+                "max_tokens": max_tokens,
+                "temperature": 0.2,
+            }
+            url = f"{provider['base_url']}/chat/completions"
+            logger.info(
+                "Trying provider: %s (model=%s)", provider["name"], provider["model"],
+            )
+
+            try:
                 resp = client.post(url, headers=headers, json=payload)
                 resp.raise_for_status()
                 data = resp.json()
-            content = data["choices"][0]["message"]["content"]
-            logger.info("Provider %s responded (%d chars)", provider["name"], len(content))
-            return content
-        except (httpx.ConnectError, httpx.TimeoutException) as e:
-            logger.warning("Provider %s unreachable: %s — trying next", provider["name"], e)
-            last_error = e
-        except httpx.HTTPStatusError as e:
-            logger.warning("Provider %s returned %s — trying next", provider["name"], e.response.status_code)
-            last_error = e
+                content = data["choices"][0]["message"]["content"]
+                logger.info("Provider %s responded (%d chars)", provider["name"], len(content))
+                return content
+            except (httpx.ConnectError, httpx.TimeoutException) as e:
+                logger.warning("Provider %s unreachable: %s — trying next", provider["name"], e)
+                last_error = e
+            except httpx.HTTPStatusError as e:
+                logger.warning("Provider %s returned %s — trying next", provider["name"], e.response.status_code)
+                last_error = e
 
     raise RuntimeError(f"All reasoning providers failed. Last error: {last_error}")
 
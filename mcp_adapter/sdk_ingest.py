@@ -19,16 +19,27 @@ Usage:
 from __future__ import annotations
 
 import argparse
+import asyncio
+import atexit
+import hashlib
+import heapq
+import importlib.util
 import json
 import os
+import random
 import re
+import sqlite3
 import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 from urllib.parse import urlparse
 
 import httpx
+import orjson
 from dotenv import load_dotenv
 
 from .logger import get_logger
@@ -70,10 +81,24 @@ PRIORITY_PATTERNS = [
     r"lib/.*\.ts$",
 ]
 
+# The pattern lists fused into one alternation each: a tree walk runs
+# one C-level scan per path instead of a Python loop of re.search calls
+_SKIP_RE = re.compile("|".join(f"(?:{p})" for p in SKIP_PATTERNS))
+_PRIORITY_RE = re.compile("|".join(f"(?:{p})" for p in PRIORITY_PATTERNS))
 
+
+# Longest extension first so ".d.ts" wins over ".ts"; the tuple lets
+# the common miss case resolve in one C-level endswith call
+_EXT_ORDER = sorted(LANGUAGE_EXTENSIONS.items(), key=lambda kv: -len(kv[0]))
+_EXT_TUPLE = tuple(ext for ext, _ in _EXT_ORDER)
+
+
+@lru_cache(maxsize=4096)
 def detect_language(filename: str) -> str | None:
     """Detect language from file extension."""
-    for ext, lang in LANGUAGE_EXTENSIONS.items():
+    if not filename.endswith(_EXT_TUPLE):
+        return None
+    for ext, lang in _EXT_ORDER:
         if filename.endswith(ext):
             return lang
     return None
@@ -81,23 +106,122 @@ def detect_language(filename: str) -> str | None:
 
 def should_skip_file(filepath: str) -> bool:
     """Check if file should be skipped."""
-    for pattern in SKIP_PATTERNS:
-        if re.search(pattern, filepath):
-            return True
-    return False
+    return _SKIP_RE.search(filepath) is not None
 
 
+@lru_cache(maxsize=4096)
 def is_priority_file(filepath: str) -> bool:
     """Check if file is a priority file."""
-    for pattern in PRIORITY_PATTERNS:
-        if re.search(pattern, filepath):
-            return True
-    return False
+    return _PRIORITY_RE.search(filepath) is not None
 
 
 # ── GitHub Fetching ───────────────────────────────────────────────────────────
 
+# ETag cache for GitHub responses: re-runs send If-None-Match and a 304
+# costs a header exchange instead of the full body — and conditional
+# requests that return 304 don't count against the API rate limit.
+_HTTP_CACHE_PATH = Path.home() / ".mcp_adapter" / "github_http_cache.sqlite"
+
+
+def _open_http_cache() -> sqlite3.Connection | None:
+    try:
+        _HTTP_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(_HTTP_CACHE_PATH)
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses "
+            "(url TEXT PRIMARY KEY, etag TEXT, body TEXT)"
+        )
+        return conn
+    except (sqlite3.Error, OSError) as e:
+        logger.warning("GitHub HTTP cache unavailable: %s", e)
+        return None
+
+
+def _http_cache_lookup(cache: sqlite3.Connection | None, url: str) -> tuple[str, str] | None:
+    if cache is None:
+        return None
+    try:
+        return cache.execute(
+            "SELECT etag, body FROM responses WHERE url = ?", (url,)
+        ).fetchone()
+    except sqlite3.Error:
+        return None
 
+
+def _http_cache_store(cache: sqlite3.Connection | None, url: str, etag: str, body: str) -> None:
+    if cache is None:
+        return
+    try:
+        cache.execute("INSERT OR REPLACE INTO responses VALUES (?, ?, ?)", (url, etag, body))
+        cache.commit()
+    except sqlite3.Error:
+        pass
+
+
+_gh_client: httpx.Client | None = None
+_gh_client_lock = threading.Lock()
+
+
+def _get_gh_client() -> httpx.Client:
+    """Lazy module-level client so GitHub calls share one connection pool.
+
+    One-shot clients paid a TCP+TLS handshake per request; the shared
+    pool keeps api.github.com and raw.githubusercontent.com connections
+    alive across tree and file fetches. HTTP/2 multiplexing kicks in
+    when the optional h2 package is installed. Closed at interpreter
+    exit.
+    """
+    global _gh_client
+    if _gh_client is None:
+        with _gh_client_lock:
+            if _gh_client is None:
+                _gh_client = httpx.Client(
+                    timeout=30.0,
+                    follow_redirects=True,
+                    http2=importlib.util.find_spec("h2") is not None,
+                    limits=httpx.Limits(max_keepalive_connections=20, max_connections=40),
+                )
+                atexit.register(_gh_client.close)
+    return _gh_client
+
+
+def _github_headers(accept: str | None = None) -> dict[str, str]:
+    """Default headers; a GITHUB_TOKEN raises the API limit 60/hr → 5000/hr."""
+    headers: dict[str, str] = {}
+    if accept:
+        headers["Accept"] = accept
+    token = os.getenv("GITHUB_TOKEN")
+    if token:
+        headers["Authorization"] = f"Bearer {token}"
+    return headers
+
+
+def _conditional_get(client: httpx.Client, url: str, headers: dict[str, str]) -> tuple[httpx.Response, str]:
+    """GET with If-None-Match; returns (response, body text).
+
+    On 304 the body comes from the on-disk cache; on 200 the new ETag
+    and body are stored for the next run. Status handling (404 probing,
+    raise_for_status) stays with the caller.
+    """
+    cache = _open_http_cache()
+    cached = _http_cache_lookup(cache, url)
+    if cached is not None:
+        headers = {**headers, "If-None-Match": cached[0]}
+    resp = client.get(url, headers=headers)
+    if resp.status_code == 304 and cached is not None:
+        if cache is not None:
+            cache.close()
+        return resp, cached[1]
+    if resp.status_code == 200:
+        etag = resp.headers.get("etag")
+        if etag:
+            _http_cache_store(cache, url, etag, resp.text)
+    if cache is not None:
+        cache.close()
+    return resp, resp.text
+
+
+@lru_cache(maxsize=128)
 def parse_github_url(url: str) -> tuple[str, str, str]:
     """Parse GitHub URL to extract owner, repo, and branch.
     
@@ -130,28 +254,83 @@ def fetch_github_tree(owner: str, repo: str, branch: str) -> list[dict]:
     
     api_url = f"https://api.github.com/repos/{owner}/{repo}/git/trees/{branch}?recursive=1"
     
-    with httpx.Client(timeout=30.0) as client:
-        resp = client.get(api_url, headers={"Accept": "application/vnd.github.v3+json"})
-        if resp.status_code == 404:
-            # Try 'master' branch if 'main' fails
-            if branch == "main":
-                return fetch_github_tree(owner, repo, "master")
-            raise ValueError(f"Repository not found: {owner}/{repo}")
+    resp, body = _conditional_get(
+        _get_gh_client(), api_url, _github_headers("application/vnd.github.v3+json")
+    )
+    if resp.status_code == 404:
+        # Try 'master' branch if 'main' fails
+        if branch == "main":
+            return fetch_github_tree(owner, repo, "master")
+        raise ValueError(f"Repository not found: {owner}/{repo}")
+    if resp.status_code != 304:
         resp.raise_for_status()
-    
-    data = resp.json()
+
+    # Recursive tree listings for big repos run to megabytes of JSON;
+    # orjson cuts that decode several-fold
+    data = orjson.loads(body)
+    if data.get("truncated"):
+        # GitHub silently caps recursive listings (~100k entries); past
+        # that the response omits the rest of the tree, so file
+        # selection may miss SDK sources deep in huge monorepos
+        logger.warning(
+            "GitHub truncated the tree for %s/%s@%s — file selection may be incomplete",
+            owner, repo, branch,
+        )
     return data.get("tree", [])
 
 
 def fetch_github_file(owner: str, repo: str, branch: str, filepath: str) -> str:
     """Fetch raw file content from GitHub."""
     raw_url = f"https://raw.githubusercontent.com/{owner}/{repo}/{branch}/{filepath}"
-    
-    with httpx.Client(timeout=30.0) as client:
-        resp = client.get(raw_url)
+
+    resp, body = _conditional_get(_get_gh_client(), raw_url, _github_headers())
+    if resp.status_code != 304:
         resp.raise_for_status()
-    
-    return resp.text
+
+    return body
+
+
+async def _fetch_github_files(
+    owner: str, repo: str, branch: str, filepaths: list[str], max_concurrency: int = 8
+) -> list[str | Exception]:
+    """Fetch several raw files concurrently over one connection pool.
+
+    Sequential fetches paid a full round-trip per file; raw file serving
+    isn't rate-limited like the API, so a bounded gather turns N
+    round-trips into roughly one. Failures come back as exceptions in
+    the corresponding slot instead of aborting the batch.
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+    cache = _open_http_cache()
+    base_headers = _github_headers()
+
+    async with httpx.AsyncClient(timeout=30.0) as client:
+
+        async def _fetch(filepath: str) -> str:
+            raw_url = f"https://raw.githubusercontent.com/{owner}/{repo}/{branch}/{filepath}"
+            # The event loop serializes cache access, so one connection
+            # is safe across all coroutines
+            cached = _http_cache_lookup(cache, raw_url)
+            headers = base_headers
+            if cached is not None:
+                headers = {**headers, "If-None-Match": cached[0]}
+            async with semaphore:
+                resp = await client.get(raw_url, headers=headers)
+            if resp.status_code == 304 and cached is not None:
+                return cached[1]
+            resp.raise_for_status()
+            etag = resp.headers.get("etag")
+            if etag:
+                _http_cache_store(cache, raw_url, etag, resp.text)
+            return resp.text
+
+        try:
+            return await asyncio.gather(
+                *(_fetch(f) for f in filepaths), return_exceptions=True
+            )
+        finally:
+            if cache is not None:
+                cache.close()
 
 
 def select_sdk_files(tree: list[dict], language: str | None = None, max_files: int = 10) -> list[str]:
@@ -160,35 +339,33 @@ def select_sdk_files(tree: list[dict], language: str | None = None, max_files: i
     Prioritizes main SDK files, skips tests and configs.
     """
     candidates = []
-    
+
     for item in tree:
         if item.get("type") != "blob":
             continue
-        
+
         filepath = item.get("path", "")
         file_lang = detect_language(filepath)
-        
+
         if file_lang is None:
             continue
-        
+
         if language and file_lang != language:
             continue
-        
+
         if should_skip_file(filepath):
             continue
-        
-        # Score files by priority
-        priority = 1 if is_priority_file(filepath) else 0
-        candidates.append((priority, filepath, file_lang))
-    
-    # Sort by priority (highest first), then by path
-    candidates.sort(key=lambda x: (-x[0], x[1]))
-    
-    # Return top files
-    selected = []
-    for _, filepath, _ in candidates[:max_files]:
-        selected.append(filepath)
-    
+
+        # Rank 0 sorts before rank 1, so priority files come first and
+        # ties break on path — the natural tuple order, no sort key
+        rank = 0 if is_priority_file(filepath) else 1
+        candidates.append((rank, filepath))
+
+    # Top-k selection: heapq.nsmallest is O(n log k) versus O(n log n)
+    # for a full sort, and large monorepo trees can have thousands of
+    # candidate paths for a max_files of 10
+    selected = [filepath for _, filepath in heapq.nsmallest(max_files, candidates)]
+
     logger.info("Selected %d files for parsing", len(selected))
     for f in selected:
         logger.info("  - %s", f)
@@ -198,24 +375,25 @@ def select_sdk_files(tree: list[dict], language: str | None = None, max_files: i
 
 # ── Gemini Parsing ────────────────────────────────────────────────────────────
 
-
-def parse_sdk_with_gemini(
-    source: str,
-    code_content: str,
-    language: str,
-    max_retries: int = 3
-) -> dict[str, Any]:
-    """Parse SDK code with Gemini API to extract tool definitions."""
-    from google import genai
-    
-    api_key = os.getenv("GEMINI_API_KEY")
-    if not api_key:
-        raise ValueError("GEMINI_API_KEY environment variable required")
-    
-    client = genai.Client(api_key=api_key)
-    
-    # SDK-specific prompt
-    prompt = f"""You are an expert SDK code analyzer. Analyze the following {language.upper()} SDK source code and extract all PUBLIC callable functions/methods that users of this library would call.
+# Cross-run parse cache: unchanged file content means an identical
+# prompt and a re-usable answer, so re-ingesting the same SDK costs no
+# tokens. Bump _PROMPT_VERSION whenever the prompt text changes.
+# One regex pass strips a markdown fence, one more grabs the JSON span
+# when the model wrapped it in prose — replacing the old line-by-line
+# Python loop over multi-KB responses
+_FENCE_RE = re.compile(r"^```(?:json)?\s*\n(.*?)\n?```\s*$", re.DOTALL)
+_JSON_SPAN_RE = re.compile(r"\{.*\}", re.DOTALL)
+
+_PARSE_CACHE_PATH = Path.home() / ".mcp_adapter" / "sdk_parse_cache.sqlite"
+_PROMPT_VERSION = 3
+_PARSE_CACHE_TTL = 30 * 86400  # seconds
+
+# All static instructions live in this prefix; the per-file input is
+# appended after ---INPUT---. Because the prefix is byte-identical
+# across every call, the provider's implicit prompt caching can reuse
+# its processed form instead of re-tokenizing ~500 instruction tokens
+# per file.
+_SDK_PROMPT_PREFIX = """You are an expert SDK code analyzer. Analyze the SDK source code given after the ---INPUT--- delimiter and extract all PUBLIC callable functions/methods that users of this library would call. The input may contain several files, each introduced by a `---FILE: path---` marker; extract tools from every file.
 
 ## Instructions
 
@@ -230,41 +408,33 @@ def parse_sdk_with_gemini(
 Return ONLY valid JSON:
 
 ```json
-{{
-  "api_info": {{
+{
+  "api_info": {
     "title": "SDK or module name",
     "version": "",
     "description": "What this SDK/module does",
     "base_url": ""
-  }},
+  },
   "tools": [
-    {{
+    {
       "name": "module.class.method_name",
       "description": "What this function does",
       "method": "FUNCTION",
       "path": "full.import.path",
       "params": [
-        {{
+        {
           "name": "param_name",
           "type": "string|int|bool|list|dict|object",
           "required": true,
           "location": "argument",
           "description": "Parameter description",
           "default": null
-        }}
+        }
       ],
       "returns": "Return type description"
-    }}
+    }
   ]
-}}
-```
-
-## {language.upper()} Source Code
-
-File: {source}
-
-```{language}
-{code_content[:40000]}
+}
 ```
 
 ## Important
@@ -272,53 +442,180 @@ File: {source}
 - Return ONLY the JSON, no markdown code blocks
 - Include ONLY public/exported functions that users would call
 - Skip internal/private methods
-- Use the full qualified name for method paths (e.g., stripe.Customer.create)"""
+- Use the full qualified name for method paths (e.g., stripe.Customer.create)
+"""
+
+
+# Rough prompt budget for one file's code. A character cap stands in
+# for a true token count — neither tiktoken nor a free local Gemini
+# tokenizer is available, and count_tokens would cost a network call
+# per file; ~40k chars of source stays safely inside the model window.
+_CODE_CHAR_BUDGET = 40000
+
+
+def _truncate_code(code: str, limit: int = _CODE_CHAR_BUDGET) -> str:
+    """Trim oversized files at a line boundary near the prompt budget.
+
+    A hard slice can cut mid-identifier or mid-string, leaving the tail
+    of the prompt as garbage tokens; backing up to the previous newline
+    costs at most one line of context.
+    """
+    if len(code) <= limit:
+        return code
+    cut = code.rfind("\n", 0, limit)
+    return code[:cut] if cut > 0 else code[:limit]
+
+
+def _parse_fingerprint(language: str, code_content: str) -> str:
+    return hashlib.blake2b(
+        f"{language}|{_PROMPT_VERSION}|{_truncate_code(code_content)}".encode()
+    ).hexdigest()
+
+
+def _open_parse_cache() -> sqlite3.Connection | None:
+    """Open (creating if needed) the on-disk cache; None if unavailable."""
+    try:
+        _PARSE_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(_PARSE_CACHE_PATH)
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS parses "
+            "(fingerprint TEXT PRIMARY KEY, result BLOB, created REAL)"
+        )
+        return conn
+    except (sqlite3.Error, OSError) as e:
+        logger.warning("SDK parse cache unavailable: %s", e)
+        return None
+
+
+_genai_client = None
+_genai_client_lock = threading.Lock()
+
+
+def _get_genai_client():
+    """Lazy module-level Gemini client shared by all parse workers.
+
+    genai.Client sets up its own HTTP connection pool; building one per
+    file threw that pool away between calls. The import stays inside so
+    google-genai remains an optional dependency for the non-SDK paths.
+    """
+    global _genai_client
+    if _genai_client is None:
+        with _genai_client_lock:
+            if _genai_client is None:
+                from google import genai
+
+                api_key = os.getenv("GEMINI_API_KEY")
+                if not api_key:
+                    raise ValueError("GEMINI_API_KEY environment variable required")
+                _genai_client = genai.Client(api_key=api_key)
+    return _genai_client
+
+
+def parse_sdk_with_gemini(
+    source: str,
+    code_content: str,
+    language: str,
+    max_retries: int = 3,
+    use_cache: bool = True,
+) -> dict[str, Any]:
+    """Parse SDK code with Gemini API to extract tool definitions."""
+    fingerprint = _parse_fingerprint(language, code_content)
+    cache = _open_parse_cache() if use_cache else None
+    if cache is not None:
+        try:
+            row = cache.execute(
+                "SELECT result, created FROM parses WHERE fingerprint = ?",
+                (fingerprint,),
+            ).fetchone()
+            if row is not None and time.time() - row[1] < _PARSE_CACHE_TTL:
+                logger.info("Parse cache hit for %s", source)
+                cache.close()
+                return orjson.loads(row[0])
+        except sqlite3.Error:
+            pass
+
+    client = _get_genai_client()
+
+
+    # Static instructions first (see _SDK_PROMPT_PREFIX), variable
+    # input last so the cacheable prefix never changes between files
+    prompt = f"""{_SDK_PROMPT_PREFIX}
+---INPUT---
+
+Language: {language.upper()}
+File: {source}
+
+```{language}
+{_truncate_code(code_content)}
+```"""
 
     # Retry with exponential backoff
     for attempt in range(max_retries):
         try:
-            response = client.models.generate_content(
-                model="gemini-2.0-flash",
-                contents=prompt,
-            )
-            
-            response_text = response.text.strip()
+            # Stream the generation and accumulate chunks as they
+            # arrive — tens of seconds of generation aren't buffered
+            # server-side before we see the first byte, and a slow or
+            # dead stream fails at the offending chunk instead of after
+            # the full response timeout
+            stream_fn = getattr(client.models, "generate_content_stream", None)
+            if stream_fn is not None:
+                parts: list[str] = []
+                for chunk in stream_fn(model="gemini-2.0-flash", contents=prompt):
+                    if chunk.text:
+                        parts.append(chunk.text)
+                response_text = "".join(parts).strip()
+            else:
+                response = client.models.generate_content(
+                    model="gemini-2.0-flash",
+                    contents=prompt,
+                )
+                response_text = response.text.strip()
             
             # Clean up response - remove markdown code blocks
-            if response_text.startswith("```"):
-                lines = response_text.split("\n")
-                end_idx = len(lines) - 1
-                for i in range(len(lines) - 1, 0, -1):
-                    if lines[i].strip() == "```":
-                        end_idx = i
-                        break
-                response_text = "\n".join(lines[1:end_idx])
-            
+            fence = _FENCE_RE.match(response_text)
+            if fence:
+                response_text = fence.group(1)
+
             # Extract JSON if there's extra text
             if not response_text.startswith("{"):
-                start = response_text.find("{")
-                end = response_text.rfind("}") + 1
-                if start != -1 and end > start:
-                    response_text = response_text[start:end]
-            
-            result = json.loads(response_text)
+                span = _JSON_SPAN_RE.search(response_text)
+                if span:
+                    response_text = span.group(0)
             
-            return {
+            # orjson parses the multi-KB model response several times
+            # faster than the stdlib; its JSONDecodeError subclasses
+            # json.JSONDecodeError, so the retry handler below still
+            # catches parse failures
+            result = orjson.loads(response_text)
+
+            parsed = {
                 "api_info": result.get("api_info", {}),
                 "tools": result.get("tools", []),
             }
-            
+            if cache is not None:
+                try:
+                    cache.execute(
+                        "INSERT OR REPLACE INTO parses VALUES (?, ?, ?)",
+                        (fingerprint, orjson.dumps(parsed), time.time()),
+                    )
+                    cache.commit()
+                    cache.close()
+                except sqlite3.Error:
+                    pass
+            return parsed
+
         except json.JSONDecodeError as e:
             logger.error("JSON parse failed (attempt %d): %s", attempt + 1, e)
             if attempt < max_retries - 1:
-                time.sleep(2 ** attempt)
+                # Jitter de-synchronizes retries from concurrent workers
+                time.sleep(2 ** attempt + random.uniform(0, 1))
             else:
                 raise ValueError(f"Gemini returned invalid JSON: {e}")
         except Exception as e:
             if "429" in str(e) or "RESOURCE_EXHAUSTED" in str(e):
                 if attempt < max_retries - 1:
-                    wait_time = 2 ** (attempt + 2)
-                    logger.warning("Rate limited, waiting %ds...", wait_time)
+                    wait_time = 2 ** (attempt + 2) + random.uniform(0, 1)
+                    logger.warning("Rate limited, waiting %.1fs...", wait_time)
                     time.sleep(wait_time)
                 else:
                     raise
@@ -328,6 +625,91 @@ File: {source}
     raise ValueError("Failed to parse with Gemini")
 
 
+def _group_entries(
+    entries: list[tuple[str, str, str]],
+) -> list[tuple[str, list[tuple[str, str]]]]:
+    """Greedily pack same-language entries into prompt-budget batches.
+
+    Returns (language, [(path, truncated code), ...]) groups. Small
+    files join a batch until the combined code would blow the prompt
+    budget; anything near the budget ends up in a batch of one, so
+    large files keep the old one-call-per-file behavior.
+    """
+    by_lang: dict[str, list[tuple[str, str]]] = {}
+    for source, content, lang in entries:
+        by_lang.setdefault(lang, []).append((source, _truncate_code(content)))
+
+    batches: list[tuple[str, list[tuple[str, str]]]] = []
+    for lang, group in by_lang.items():
+        current: list[tuple[str, str]] = []
+        size = 0
+        for source, code in group:
+            # marker overhead: "---FILE: {path}---" plus surrounding newlines
+            cost = len(code) + len(source) + 16
+            if current and size + cost > _CODE_CHAR_BUDGET:
+                batches.append((lang, current))
+                current, size = [], 0
+            current.append((source, code))
+            size += cost
+        if current:
+            batches.append((lang, current))
+    return batches
+
+
+def _parse_files_concurrently(
+    entries: list[tuple[str, str, str]],
+    concurrency: int = 4,
+    use_cache: bool = True,
+) -> list[dict]:
+    """Run parse_sdk_with_gemini over (source, content, lang) entries.
+
+    Each call is a blocking network RPC, so a small thread pool overlaps
+    them; the jittered backoff in the parser keeps concurrent retries
+    from stampeding the rate limit. Identical contents (duplicated
+    __init__.py files, vendored copies) are parsed once, and small
+    files of the same language are joined into one request under
+    ---FILE: path--- markers so the fixed instruction tokens and
+    round-trip are paid per batch, not per file. Failed batches are
+    logged and dropped, matching the old serial loop.
+    """
+    def _one_batch(batch: tuple[str, list[tuple[str, str]]]) -> dict | None:
+        lang, members = batch
+        if len(members) == 1:
+            source, code = members[0]
+        else:
+            source = f"{members[0][0]} (+{len(members) - 1} more)"
+            code = "\n".join(
+                f"---FILE: {path}---\n{text}" for path, text in members
+            )
+        logger.info("Parsing: %s", source)
+        try:
+            result = parse_sdk_with_gemini(source, code, lang, use_cache=use_cache)
+            logger.info("  → Found %d tools", len(result.get("tools", [])))
+            return result
+        except Exception as e:
+            logger.warning("Failed to parse %s: %s", source, e)
+            return None
+
+    # Drop entries whose (language, content) already appeared
+    unique: list[tuple[str, str, str]] = []
+    seen: set[tuple[str, bytes]] = set()
+    for source, content, lang in entries:
+        key = (lang, hashlib.blake2b(_truncate_code(content).encode(), digest_size=16).digest())
+        if key in seen:
+            logger.info("Skipping %s — identical content already queued", source)
+            continue
+        seen.add(key)
+        unique.append((source, content, lang))
+
+    batches = _group_entries(unique)
+    if len(batches) <= 1 or concurrency <= 1:
+        parsed = [_one_batch(b) for b in batches]
+    else:
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            parsed = list(pool.map(_one_batch, batches))
+    return [r for r in parsed if r is not None]
+
+
 def merge_results(results: list[dict], source: str) -> dict[str, Any]:
     """Merge multiple file parsing results into one."""
     all_tools = []
@@ -350,7 +732,13 @@ def merge_results(results: list[dict], source: str) -> dict[str, Any]:
 # ── Main Ingestion ────────────────────────────────────────────────────────────
 
 
-def ingest_github(url: str, language: str | None = None, max_files: int = 10) -> dict[str, Any]:
+def ingest_github(
+    url: str,
+    language: str | None = None,
+    max_files: int = 10,
+    concurrency: int = 4,
+    use_cache: bool = True,
+) -> dict[str, Any]:
     """Ingest SDK from GitHub repository."""
     owner, repo, branch = parse_github_url(url)
     
@@ -363,30 +751,21 @@ def ingest_github(url: str, language: str | None = None, max_files: int = 10) ->
     if not files:
         raise ValueError(f"No SDK files found in {url}")
     
-    # Parse each file
-    results = []
-    for filepath in files:
-        logger.info("Parsing: %s", filepath)
-        
-        try:
-            content = fetch_github_file(owner, repo, branch, filepath)
-            lang = detect_language(filepath) or "python"
-            
-            result = parse_sdk_with_gemini(filepath, content, lang)
-            results.append(result)
-            
-            logger.info("  → Found %d tools", len(result.get('tools', [])))
-            
-            # Small delay between API calls
-            time.sleep(1)
-            
-        except Exception as e:
-            logger.warning("Failed to parse %s: %s", filepath, e)
-    
+    # Fetch all selected files concurrently, then parse
+    contents = asyncio.run(_fetch_github_files(owner, repo, branch, files))
+
+    entries = []
+    for filepath, content in zip(files, contents):
+        if isinstance(content, Exception):
+            logger.warning("Failed to fetch %s: %s", filepath, content)
+            continue
+        entries.append((filepath, content, detect_language(filepath) or "python"))
+
+    results = _parse_files_concurrently(entries, concurrency, use_cache)
     return merge_results(results, url)
 
 
-def ingest_file(filepath: str) -> dict[str, Any]:
+def ingest_file(filepath: str, use_cache: bool = True) -> dict[str, Any]:
     """Ingest SDK from local file."""
     path = Path(filepath)
     
@@ -398,7 +777,7 @@ def ingest_file(filepath: str) -> dict[str, Any]:
     
     logger.info("Parsing local file: %s (%s)", filepath, language)
     
-    result = parse_sdk_with_gemini(str(path), content, language)
+    result = parse_sdk_with_gemini(str(path), content, language, use_cache=use_cache)
     
     return {
         "source": str(path.absolute()),
@@ -408,23 +787,39 @@ def ingest_file(filepath: str) -> dict[str, Any]:
     }
 
 
-def ingest_directory(dirpath: str, language: str | None = None, max_files: int = 10) -> dict[str, Any]:
+def ingest_directory(
+    dirpath: str,
+    language: str | None = None,
+    max_files: int = 10,
+    concurrency: int = 4,
+    use_cache: bool = True,
+) -> dict[str, Any]:
     """Ingest SDK from local directory."""
     path = Path(dirpath)
     
     if not path.is_dir():
         raise ValueError(f"Directory not found: {dirpath}")
     
-    # Find relevant files
+    # Find relevant files in one walk: the old per-extension rglob
+    # traversed the whole tree once per extension, and descending into
+    # pruned directories only to filter their files afterwards wasted
+    # the bulk of the stat calls
     files = []
-    for ext in LANGUAGE_EXTENSIONS:
-        for filepath in path.rglob(f"*{ext}"):
-            rel_path = str(filepath.relative_to(path))
-            if not should_skip_file(rel_path):
-                file_lang = detect_language(str(filepath))
-                if language is None or file_lang == language:
-                    priority = 1 if is_priority_file(rel_path) else 0
-                    files.append((priority, filepath))
+    root_str = str(path)
+    skip_dirs = {"__pycache__", ".git", "node_modules", "tests", "test"}
+    for cur_dir, dirnames, filenames in os.walk(root_str):
+        dirnames[:] = [d for d in dirnames if d not in skip_dirs]
+        rel_dir = os.path.relpath(cur_dir, root_str)
+        rel_prefix = "" if rel_dir == "." else rel_dir + "/"
+        for fn in filenames:
+            file_lang = detect_language(fn)
+            if file_lang is None or (language is not None and file_lang != language):
+                continue
+            rel_path = rel_prefix + fn
+            if should_skip_file(rel_path):
+                continue
+            priority = 1 if is_priority_file(rel_path) else 0
+            files.append((priority, Path(cur_dir) / fn))
     
     # Sort by priority
     files.sort(key=lambda x: -x[0])
@@ -432,24 +827,16 @@ def ingest_directory(dirpath: str, language: str | None = None, max_files: int =
     
     logger.info("Selected %d files from %s", len(files), dirpath)
     
-    # Parse each file
-    results = []
+    entries = []
     for filepath in files:
-        logger.info("Parsing: %s", filepath)
-        
         try:
             content = filepath.read_text(encoding="utf-8")
-            lang = detect_language(str(filepath)) or "python"
-            
-            result = parse_sdk_with_gemini(str(filepath), content, lang)
-            results.append(result)
-            
-            logger.info("  → Found %d tools", len(result.get('tools', [])))
-            time.sleep(1)
-            
-        except Exception as e:
-            logger.warning("Failed to parse %s: %s", filepath, e)
-    
+        except OSError as e:
+            logger.warning("Failed to read %s: %s", filepath, e)
+            continue
+        entries.append((str(filepath), content, detect_language(str(filepath)) or "python"))
+
+    results = _parse_files_concurrently(entries, concurrency, use_cache)
     return merge_results(results, str(path.absolute()))
 
 
@@ -459,24 +846,26 @@ def ingest(
     language: str | None = None,
     max_files: int = 10,
     output_path: str | None = None,
+    concurrency: int = 4,
+    use_cache: bool = True,
 ) -> dict[str, Any]:
     """Main ingestion function."""
     # Parse based on source type
     if source_type == "github":
-        result = ingest_github(source, language, max_files)
+        result = ingest_github(source, language, max_files, concurrency, use_cache)
     elif source_type == "file":
-        result = ingest_file(source)
+        result = ingest_file(source, use_cache)
     elif source_type == "dir":
-        result = ingest_directory(source, language, max_files)
+        result = ingest_directory(source, language, max_files, concurrency, use_cache)
     else:
         raise ValueError(f"Unknown source type: {source_type}")
     
     # Write output if path given
     if output_path:
         logger.info("Writing output to: %s", output_path)
-        Path(output_path).write_text(
-            json.dumps(result, indent=2, ensure_ascii=False),
-            encoding="utf-8"
+        # orjson encodes straight to UTF-8 bytes — no intermediate str
+        Path(output_path).write_bytes(
+            orjson.dumps(result, option=orjson.OPT_INDENT_2)
         )
     
     logger.info("SDK Ingestion complete — SDK: %s, Tools: %d",
@@ -520,6 +909,17 @@ def main():
         "--output", "-o",
         help="Output file path",
     )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=4,
+        help="Parallel Gemini parse calls (default: 4, max: 8)",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Skip the on-disk Gemini parse cache",
+    )
     
     args = parser.parse_args()
     
@@ -538,6 +938,8 @@ def main():
             language=args.lang,
             max_files=args.max_files,
             output_path=args.output,
+            concurrency=max(1, min(args.concurrency, 8)),
+            use_cache=not args.no_cache,
         )
     except Exception as e:
         print(f"[ERROR] SDK ingestion failed: {e}")
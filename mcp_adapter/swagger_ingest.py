@@ -17,16 +17,29 @@ Usage:
 from __future__ import annotations
 
 import argparse
+import atexit
+import hashlib
+import importlib.util
 import json
 import os
+import re
+import sqlite3
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import chain
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 from urllib.parse import urlparse
 
-import httpx
+import orjson
 from dotenv import load_dotenv
 
+if TYPE_CHECKING:
+    import httpx
+
 from .logger import get_logger
 
 load_dotenv()
@@ -44,36 +57,193 @@ def is_url(source: str) -> bool:
         return False
 
 
+_http_client: httpx.Client | None = None
+_http_client_lock = threading.Lock()
+
+
+def _get_http_client() -> httpx.Client:
+    """Lazy module-level client so all fetches share one connection pool.
+
+    A one-shot client per fetch_url call paid a TCP+TLS handshake every
+    time, and ingest hits the same host at least twice (detect, then
+    parse). HTTP/2 multiplexing kicks in when the optional h2 package
+    is installed. Closed at interpreter exit.
+    """
+    global _http_client
+    if _http_client is None:
+        with _http_client_lock:
+            if _http_client is None:
+                # Deferred: httpx costs a few hundred ms to import and
+                # --help / argument-error runs never fetch anything
+                import httpx
+
+                _http_client = httpx.Client(
+                    timeout=httpx.Timeout(30.0, connect=10.0, pool=5.0),
+                    follow_redirects=True,
+                    http2=importlib.util.find_spec("h2") is not None,
+                    limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+                )
+                atexit.register(_http_client.close)
+    return _http_client
+
+
 def fetch_url(url: str) -> str:
     """Fetch content from a URL."""
     logger.info("Fetching content from: %s", url)
-    with httpx.Client(timeout=30.0, follow_redirects=True) as client:
-        resp = client.get(url, headers={"Accept": "application/json, application/yaml, */*"})
-        resp.raise_for_status()
+    resp = _get_http_client().get(
+        url, headers={"Accept": "application/json, application/yaml, */*"}
+    )
+    resp.raise_for_status()
     return resp.text
 
 
-def parse_with_prance(source: str) -> dict[str, Any]:
+# URL memo entries live one time bucket; local files invalidate on mtime
+_SOURCE_TTL = 300.0  # seconds
+
+
+@lru_cache(maxsize=8)
+def _read_source(source: str, _freshness: int) -> str:
+    """Memoized fetch/read; _freshness only varies the cache key."""
+    if is_url(source):
+        return fetch_url(source)
+    return Path(source).read_text(encoding="utf-8")
+
+
+def _load_source(source: str) -> str:
+    """Fetch or read a source once per process.
+
+    ingest touches the same source twice — detection, then parsing —
+    and a large spec (Stripe is ~4MB) would otherwise be downloaded or
+    read both times. Local files are keyed on (path, mtime), so editing
+    a spec on disk busts the entry even in a long-lived process like
+    api_server; URL keys carry a time bucket, so a remote spec is
+    re-fetched at most every _SOURCE_TTL seconds rather than pinned for
+    the process lifetime.
+    """
+    if is_url(source):
+        freshness = int(time.monotonic() // _SOURCE_TTL)
+    else:
+        freshness = os.stat(source).st_mtime_ns
+    return _read_source(source, freshness)
+
+
+def _parse_spec_text(content: str) -> dict[str, Any]:
+    """Parse raw spec text — orjson for JSON, the C YAML loader otherwise."""
+    if content.lstrip().startswith("{"):
+        return orjson.loads(content)
+    import yaml
+
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    return yaml.load(content, Loader=loader)
+
+
+def _spec_to_tools(spec: dict[str, Any]) -> list[dict[str, Any]]:
+    """Turn a resolved spec's paths into tool definitions.
+
+    Pure dict/list traversal with no I/O — kept as a standalone
+    function so the hot loop is benchmarkable in isolation and could
+    be compiled (mypyc/Cython) if profiles ever justify adding a build
+    step to this pure-Python package.
+    """
+    tools: list[dict[str, Any]] = []
+    for path, path_item in spec.get("paths", {}).items():
+        if not isinstance(path_item, dict):
+            continue
+
+        # Path-level params apply to every operation under this
+        # path — fetch them once, not once per method
+        path_params = path_item.get("parameters", ())
+
+        # Iterate the keys that exist instead of probing all seven
+        # methods per path — most paths carry one or two operations
+        for method, operation in path_item.items():
+            method_upper = _METHOD_UPPER.get(method)
+            if method_upper is None or not isinstance(operation, dict) or not operation:
+                continue
+
+            # Bound .get saves an attribute dispatch per lookup in
+            # the hot loop (Stripe-scale specs hit this thousands
+            # of times)
+            og = operation.get
+
+            # Build tool definition
+            operation_id = og("operationId", "")
+            if not operation_id:
+                # Generate operation ID from method + path
+                operation_id = f"{method}_{path.replace('/', '_').strip('_')}"
+
+            # Path-level + operation-level params; chain avoids
+            # allocating a concatenated list per operation and map
+            # drives the _mk_param kernel from C
+            params = list(map(_mk_param, chain(path_params, og("parameters", ()))))
+
+            # Request body (OpenAPI 3.x)
+            request_body = og("requestBody")
+            if request_body:
+                content = request_body.get("content", {})
+                json_schema = content.get("application/json", {}).get("schema", {})
+                if json_schema:
+                    required_fields = set(json_schema.get("required", []))
+                    for prop_name, prop_schema in json_schema.get("properties", {}).items():
+                        params.append({
+                            "name": prop_name,
+                            "type": prop_schema.get("type", "string"),
+                            "required": prop_name in required_fields,
+                            "location": "body",
+                            "description": prop_schema.get("description", ""),
+                        })
+
+            tools.append({
+                "name": operation_id,
+                "description": og("summary", "") or og("description", ""),
+                "method": method_upper,
+                "path": path,
+                "params": params,
+                "tags": og("tags", []),
+                "deprecated": og("deprecated", False),
+            })
+    return tools
+
+
+def parse_with_prance(source: str, fast: bool = False) -> dict[str, Any]:
     """Parse OpenAPI/Swagger spec using Prance ResolvingParser.
-    
+
     Prance handles:
     - $ref resolution (local and remote)
     - Swagger 2.x and OpenAPI 3.x
     - YAML and JSON formats
     - URL and file sources
+
+    With ``fast`` set, meta-schema validation is skipped: the spec is
+    loaded directly and only run through Prance's \$ref resolver, which
+    dominates far less of the runtime than validation on big specs.
     """
-    from prance import ResolvingParser
-    
     logger.info("Parsing with Prance: %s", source)
-    
+
     try:
-        # Increase recursion limit for large specs like Stripe
-        parser = ResolvingParser(source, strict=False, recursion_limit=100)
-        spec = parser.specification
-        
+        if fast:
+            from prance.util.fs import abspath
+            from prance.util.resolver import RefResolver
+            from prance.util.url import absurl
+
+            spec = _parse_spec_text(_load_source(source))
+            resolver = RefResolver(
+                spec,
+                absurl(source, abspath(os.getcwd())),
+                recursion_limit=100,
+            )
+            resolver.resolve_references()
+            spec = resolver.specs
+        else:
+            from prance import ResolvingParser
+
+            # Increase recursion limit for large specs like Stripe
+            parser = ResolvingParser(source, strict=False, recursion_limit=100)
+            spec = parser.specification
+
         # Extract API info
         info = spec.get("info", {})
-        
+
         # Determine base URL
         base_url = ""
         servers = spec.get("servers", [])
@@ -82,64 +252,7 @@ def parse_with_prance(source: str) -> dict[str, Any]:
         elif "host" in spec:
             scheme = (spec.get("schemes") or ["https"])[0]
             base_url = f"{scheme}://{spec['host']}{spec.get('basePath', '')}"
-        
-        # Extract tools from paths
-        tools = []
-        for path, path_item in spec.get("paths", {}).items():
-            if not isinstance(path_item, dict):
-                continue
-                
-            for method in ("get", "post", "put", "patch", "delete", "head", "options"):
-                operation = path_item.get(method)
-                if not operation:
-                    continue
-                
-                # Build tool definition
-                operation_id = operation.get("operationId", "")
-                if not operation_id:
-                    # Generate operation ID from method + path
-                    operation_id = f"{method}_{path.replace('/', '_').strip('_')}"
-                
-                # Collect parameters
-                params = []
-                
-                # Path-level + operation-level params
-                all_params = path_item.get("parameters", []) + operation.get("parameters", [])
-                for p in all_params:
-                    params.append({
-                        "name": p.get("name", ""),
-                        "type": p.get("schema", {}).get("type", p.get("type", "string")),
-                        "required": p.get("required", False),
-                        "location": p.get("in", "query"),
-                        "description": p.get("description", ""),
-                    })
-                
-                # Request body (OpenAPI 3.x)
-                request_body = operation.get("requestBody")
-                if request_body:
-                    content = request_body.get("content", {})
-                    json_schema = content.get("application/json", {}).get("schema", {})
-                    if json_schema:
-                        required_fields = set(json_schema.get("required", []))
-                        for prop_name, prop_schema in json_schema.get("properties", {}).items():
-                            params.append({
-                                "name": prop_name,
-                                "type": prop_schema.get("type", "string"),
-                                "required": prop_name in required_fields,
-                                "location": "body",
-                                "description": prop_schema.get("description", ""),
-                            })
-                
-                tools.append({
-                    "name": operation_id,
-                    "description": operation.get("summary", "") or operation.get("description", ""),
-                    "method": method.upper(),
-                    "path": path,
-                    "params": params,
-                    "tags": operation.get("tags", []),
-                    "deprecated": operation.get("deprecated", False),
-                })
-        
+
         return {
             "source": source,
             "parser": "prance",
@@ -149,7 +262,7 @@ def parse_with_prance(source: str) -> dict[str, Any]:
                 "description": info.get("description", ""),
                 "base_url": base_url,
             },
-            "tools": tools,
+            "tools": _spec_to_tools(spec),
         }
         
     except Exception as e:
@@ -157,36 +270,95 @@ def parse_with_prance(source: str) -> dict[str, Any]:
         raise
 
 
-def parse_with_gemini(source: str, content: str | None = None, max_retries: int = 3) -> dict[str, Any]:
-    """Use Gemini API to extract tool definitions from messy/non-standard docs.
-    
-    Best for:
-    - Non-standard documentation formats
-    - Markdown API docs
-    - Poorly formatted specs
-    - Documentation without proper OpenAPI structure
+_FENCE_RE = re.compile(r"^```(?:json)?\s*\n(.*?)\n?```\s*$", re.DOTALL)
+_JSON_SPAN_RE = re.compile(r"\{.*\}", re.DOTALL)
+
+
+class _TokenBucket:
+    """Request pacing shared by all Gemini callers in this process.
+
+    Refills continuously at ``rate`` tokens per second up to
+    ``capacity``; acquire() blocks until a token is free. Thread-safe,
+    so concurrent batch workers self-throttle at the quota ceiling
+    instead of bursting into 429s and then idling through backoff.
     """
-    import time
-    from google import genai
-    
-    api_key = os.getenv("GEMINI_API_KEY")
-    if not api_key:
-        raise ValueError("GEMINI_API_KEY environment variable is required for Gemini parsing")
-    
-    logger.info("Parsing with Gemini API: %s", source)
-    
-    # Load content if not provided
-    if content is None:
-        if is_url(source):
-            content = fetch_url(source)
-        else:
-            content = Path(source).read_text(encoding="utf-8")
-    
-    # Initialize Gemini client
-    client = genai.Client(api_key=api_key)
-    
-    # Improved prompt for extracting API tool definitions
-    prompt = f"""You are an expert API documentation parser. Your task is to extract ALL API endpoints from the documentation below and convert them into structured tool definitions.
+
+    def __init__(self, rate: float, capacity: float) -> None:
+        self._rate = rate
+        self._capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    self._capacity, self._tokens + (now - self._updated) * self._rate
+                )
+                self._updated = now
+                if self._tokens >= 1.0:
+                    self._tokens -= 1.0
+                    return
+                wait = (1.0 - self._tokens) / self._rate
+            time.sleep(wait)
+
+
+# Defaults to the free-tier 60 requests/min; override via GEMINI_RPM
+_GEMINI_RPM = float(os.getenv("GEMINI_RPM", "60"))
+_gemini_bucket = _TokenBucket(rate=_GEMINI_RPM / 60.0, capacity=max(1.0, _GEMINI_RPM))
+
+
+def _retry_after_seconds(exc: Exception) -> float | None:
+    """Pull a Retry-After hint off a rate-limit error, if the SDK kept one."""
+    headers = getattr(getattr(exc, "response", None), "headers", None)
+    if headers is None:
+        return None
+    try:
+        value = headers.get("Retry-After")
+        return float(value) if value else None
+    except (TypeError, ValueError):
+        return None
+
+
+# Rough prompt budget for the documentation tail. A character cap
+# stands in for a true token count — neither tiktoken nor a free local
+# Gemini tokenizer is available, and count_tokens would add a billable
+# round-trip per call.
+_GEMINI_DOC_BUDGET = 50000
+
+_HSPACE_RE = re.compile(r"[ \t]{2,}")
+_VSPACE_RE = re.compile(r"\n{3,}")
+
+
+def _prepare_doc(content: str, limit: int = _GEMINI_DOC_BUDGET) -> str:
+    """Condense and truncate oversized documentation for the prompt.
+
+    A hard character slice wasted budget on indentation and blank-line
+    runs (pretty-printed JSON is mostly whitespace) and could cut
+    mid-word. Oversized documents first have whitespace runs collapsed,
+    then are trimmed at the last line break inside the budget; small
+    documents pass through untouched.
+    """
+    if len(content) <= limit:
+        return content
+    content = _VSPACE_RE.sub("\n\n", _HSPACE_RE.sub(" ", content))
+    if len(content) <= limit:
+        return content
+    cut = content.rfind("\n", 0, limit)
+    return content[:cut] if cut > 0 else content[:limit]
+
+
+# All static instructions live in this prefix; the per-call document is
+# appended after the final heading. A byte-identical prefix across
+# calls lets the provider's implicit prompt caching reuse its processed
+# form instead of re-billing the ~2KB preamble as fresh input. Explicit
+# context caching (client.caches.create) was considered and rejected:
+# the preamble is well under the model's minimum cacheable size, and a
+# CLI that typically makes one call per run would pay a cache-creation
+# round-trip plus hourly TTL storage for nothing.
+_GEMINI_PROMPT_PREFIX = """You are an expert API documentation parser. Your task is to extract ALL API endpoints from the documentation below and convert them into structured tool definitions.
 
 ## Instructions
 
@@ -195,54 +367,85 @@ def parse_with_gemini(source: str, content: str | None = None, max_retries: int
 3. **Use snake_case** for all tool names (e.g., create_user, get_todos_by_id)
 4. **Infer parameter types** from context (string, integer, boolean, object, array)
 5. **Mark parameters as required** based on documentation clues like "required", "must", or lack of "optional"
-6. **Identify parameter locations**: path (in URL like /users/{{id}}), query (?param=value), body (JSON payload), header (HTTP headers)
+6. **Identify parameter locations**: path (in URL like /users/{id}), query (?param=value), body (JSON payload), header (HTTP headers)
 
 ## Output Format
 
 Return ONLY valid JSON matching this exact structure:
 
 ```json
-{{
-  "api_info": {{
+{
+  "api_info": {
     "title": "API name from docs or 'Unknown API'",
     "version": "Version if mentioned or empty string",
     "description": "Brief description of the API purpose",
     "base_url": "Base URL if mentioned or empty string"
-  }},
+  },
   "tools": [
-    {{
+    {
       "name": "snake_case_function_name",
       "description": "Clear description of what this endpoint does",
       "method": "GET|POST|PUT|PATCH|DELETE",
-      "path": "/path/with/{{param_placeholders}}",
+      "path": "/path/with/{param_placeholders}",
       "params": [
-        {{
+        {
           "name": "param_name",
           "type": "string|integer|boolean|object|array",
           "required": true,
           "location": "path|query|body|header",
           "description": "What this parameter is for"
-        }}
+        }
       ]
-    }}
+    }
   ]
-}}
+}
 ```
 
-## API Documentation to Parse
-
-{content[:50000]}
-
 ## Important
 
 - Return ONLY the JSON object, no markdown code blocks or explanation
 - Include ALL endpoints found in the documentation
 - If authentication is mentioned, include auth parameters (like API keys as header params)
-- Path parameters should use {{param}} syntax in the path field"""
+- Path parameters should use {param} syntax in the path field
+
+## API Documentation to Parse
+
+"""
+
+
+def parse_with_gemini(source: str, content: str | None = None, max_retries: int = 3) -> dict[str, Any]:
+    """Use Gemini API to extract tool definitions from messy/non-standard docs.
+    
+    Best for:
+    - Non-standard documentation formats
+    - Markdown API docs
+    - Poorly formatted specs
+    - Documentation without proper OpenAPI structure
+    """
+    from google import genai
+
+    api_key = os.getenv("GEMINI_API_KEY")
+    if not api_key:
+        raise ValueError("GEMINI_API_KEY environment variable is required for Gemini parsing")
+    
+    logger.info("Parsing with Gemini API: %s", source)
+    
+    # Load content if not provided (cached — detection already read it)
+    if content is None:
+        content = _load_source(source)
+    
+    # Initialize Gemini client
+    client = genai.Client(api_key=api_key)
+
+    # Static instructions first (see _GEMINI_PROMPT_PREFIX), variable
+    # documentation last so the cacheable prefix never changes
+    prompt = _GEMINI_PROMPT_PREFIX + _prepare_doc(content)
 
     # Retry with exponential backoff
     for attempt in range(max_retries):
         try:
+            # Pace the request against the shared quota before sending
+            _gemini_bucket.acquire()
             response = client.models.generate_content(
                 model="gemini-2.5-flash",
                 contents=prompt,
@@ -250,27 +453,23 @@ Return ONLY valid JSON matching this exact structure:
             
             # Parse response
             response_text = response.text.strip()
-            
-            # Remove markdown code blocks if present (handles ```json and ``` variants)
-            if response_text.startswith("```"):
-                lines = response_text.split("\n")
-                # Find the ending ``` 
-                end_idx = len(lines) - 1
-                for i in range(len(lines) - 1, 0, -1):
-                    if lines[i].strip() == "```":
-                        end_idx = i
-                        break
-                response_text = "\n".join(lines[1:end_idx])
-            
-            # Try to extract JSON if there's extra text
+
+            # One regex pass strips a markdown fence, one more grabs
+            # the JSON span when the model wrapped it in prose —
+            # replacing the old line-split and find/rfind passes over
+            # a potentially 100KB response
+            fence = _FENCE_RE.match(response_text)
+            if fence:
+                response_text = fence.group(1)
+
             if not response_text.startswith("{"):
-                # Find first { and last }
-                start = response_text.find("{")
-                end = response_text.rfind("}") + 1
-                if start != -1 and end > start:
-                    response_text = response_text[start:end]
-            
-            result = json.loads(response_text)
+                span = _JSON_SPAN_RE.search(response_text)
+                if span:
+                    response_text = span.group(0)
+
+            # orjson's JSONDecodeError subclasses json.JSONDecodeError,
+            # so the retry handler below is unchanged
+            result = orjson.loads(response_text)
             
             # Validate structure
             if "tools" not in result:
@@ -297,8 +496,10 @@ Return ONLY valid JSON matching this exact structure:
             error_str = str(e)
             if "429" in error_str or "RESOURCE_EXHAUSTED" in error_str:
                 if attempt < max_retries - 1:
-                    wait_time = 2 ** (attempt + 2)
-                    logger.warning("Rate limited, waiting %ds before retry...", wait_time)
+                    # Prefer the server's own Retry-After hint; blind
+                    # exponential backoff only when none was sent
+                    wait_time = _retry_after_seconds(e) or 2 ** (attempt + 2)
+                    logger.warning("Rate limited, waiting %.0fs before retry...", wait_time)
                     time.sleep(wait_time)
                 else:
                     raise
@@ -308,50 +509,154 @@ Return ONLY valid JSON matching this exact structure:
     raise ValueError("Failed to parse with Gemini after all retries")
 
 
+# Read-only default for parameters without a schema; never escapes
+# _mk_param, so sharing one instance is safe
+_NO_SCHEMA: dict[str, Any] = {}
+
+
+def _mk_param(p: dict[str, Any], _get=dict.get) -> dict[str, Any]:
+    """Flatten one OpenAPI parameter into the tool-param shape.
+
+    dict.get is bound at definition time: specs carry thousands of
+    parameters and each of the five lookups here would otherwise pay a
+    method-dispatch on top of the dict access.
+    """
+    return {
+        "name": _get(p, "name", ""),
+        "type": _get(_get(p, "schema", _NO_SCHEMA), "type", _get(p, "type", "string")),
+        "required": _get(p, "required", False),
+        "location": _get(p, "in", "query"),
+        "description": _get(p, "description", ""),
+    }
+
+
+# HTTP methods an operation can live under, mapped to their upper-case
+# form once — the hot loop neither probes absent methods nor calls
+# .upper() per operation
+_METHOD_UPPER = {
+    "get": "GET",
+    "post": "POST",
+    "put": "PUT",
+    "patch": "PATCH",
+    "delete": "DELETE",
+    "head": "HEAD",
+    "options": "OPTIONS",
+}
+
+
+# A version marker ("openapi": / swagger: — optionally quoted) sits in
+# the top-level preamble of every spec, so the first few KB decide
+_SPEC_MARKER_RE = re.compile(r"[\"']?(?:openapi|swagger)[\"']?\s*:", re.IGNORECASE)
+
+
 def detect_source_type(source: str) -> str:
     """Detect if source is OpenAPI/Swagger or needs Gemini parsing.
-    
+
     Returns: 'openapi' or 'unknown'
     """
     try:
         if is_url(source):
-            content = fetch_url(source)
+            head = _load_source(source)[:4096]
         else:
-            content = Path(source).read_text(encoding="utf-8")
-        
-        # Check for OpenAPI/Swagger markers
-        content_lower = content.lower()
-        if '"openapi"' in content_lower or "'openapi'" in content_lower:
-            return "openapi"
-        if '"swagger"' in content_lower or "'swagger'" in content_lower:
+            # Only the head decides — don't pull a multi-MB local file
+            # into memory when Prance is going to read it itself anyway
+            with open(source, encoding="utf-8") as f:
+                head = f.read(4096)
+
+        # One compiled scan over the head — the old code lowercased the
+        # whole document (a full copy of a multi-MB spec) and ran six
+        # separate substring passes over it
+        if _SPEC_MARKER_RE.search(head):
             return "openapi"
-        if "openapi:" in content_lower:
-            return "openapi"
-        if "swagger:" in content_lower:
-            return "openapi"
-        
+
         return "unknown"
     except Exception:
         return "unknown"
 
 
+# Cross-run result cache: unchanged spec content means identical tool
+# definitions, so a re-run costs one file read instead of a full parse
+# (or a paid Gemini call). Bump _PARSER_VERSION whenever the extraction
+# logic changes shape.
+_TOOLS_CACHE_PATH = Path.home() / ".mcp_adapter" / "swagger_tools_cache.sqlite"
+_PARSER_VERSION = 1
+_TOOLS_CACHE_TTL = 30 * 86400  # seconds
+
+
+def _open_tools_cache() -> sqlite3.Connection | None:
+    """Open (creating if needed) the on-disk cache; None if unavailable."""
+    try:
+        _TOOLS_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(_TOOLS_CACHE_PATH)
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS ingests "
+            "(fingerprint TEXT PRIMARY KEY, result BLOB, created REAL)"
+        )
+        return conn
+    except (sqlite3.Error, OSError) as e:
+        logger.warning("Swagger tools cache unavailable: %s", e)
+        return None
+
+
+def _tools_fingerprint(content: str, mode: str) -> str:
+    return hashlib.sha256(
+        f"{mode}|{_PARSER_VERSION}|{content}".encode()
+    ).hexdigest()
+
+
 def ingest(
     source: str,
     use_gemini: bool = False,
     output_path: str | None = None,
+    use_cache: bool = True,
+    fast: bool = False,
 ) -> dict[str, Any]:
     """Main ingestion function.
-    
+
     Args:
         source: URL or file path to API docs
         use_gemini: Force using Gemini API even for OpenAPI specs
         output_path: Path to write output JSON (default: test_application/raw_tool_definitions.json)
-    
+        use_cache: Reuse cached tool definitions for unchanged content
+        fast: Skip OpenAPI meta-schema validation; resolve refs only
+
     Returns:
         Dict with source, parser, api_info, and tools
     """
     result: dict[str, Any]
-    
+
+    # Content-addressed lookup before any parsing; _load_source is
+    # memoized, so detection below reuses the same bytes
+    fingerprint = None
+    cache = None
+    if use_cache:
+        try:
+            content = _load_source(source)
+        except Exception:
+            content = None
+        if content is not None:
+            fingerprint = _tools_fingerprint(content, "gemini" if use_gemini else "auto")
+            cache = _open_tools_cache()
+        if cache is not None:
+            try:
+                row = cache.execute(
+                    "SELECT result, created FROM ingests WHERE fingerprint = ?",
+                    (fingerprint,),
+                ).fetchone()
+                if row is not None and time.time() - row[1] < _TOOLS_CACHE_TTL:
+                    logger.info("Tools cache hit for %s", source)
+                    cache.close()
+                    result = orjson.loads(row[0])
+                    result["source"] = source
+                    if output_path:
+                        logger.info("Writing output to: %s", output_path)
+                        Path(output_path).write_bytes(
+                            orjson.dumps(result, option=orjson.OPT_INDENT_2)
+                        )
+                    return result
+            except sqlite3.Error:
+                pass
+
     if use_gemini:
         # Force Gemini parsing
         result = parse_with_gemini(source)
@@ -361,7 +666,7 @@ def ingest(
         
         if source_type == "openapi":
             try:
-                result = parse_with_prance(source)
+                result = parse_with_prance(source, fast=fast)
             except Exception as e:
                 logger.warning("Prance failed, falling back to Gemini: %s", e)
                 result = parse_with_gemini(source)
@@ -370,13 +675,24 @@ def ingest(
             logger.info("Source doesn't appear to be OpenAPI, using Gemini")
             result = parse_with_gemini(source)
     
+    if cache is not None:
+        try:
+            cache.execute(
+                "INSERT OR REPLACE INTO ingests VALUES (?, ?, ?)",
+                (fingerprint, orjson.dumps(result), time.time()),
+            )
+            cache.commit()
+            cache.close()
+        except sqlite3.Error:
+            pass
+
     # Write output if path given
     if output_path:
         logger.info("Writing output to: %s", output_path)
-        Path(output_path).write_text(
-            json.dumps(result, indent=2, ensure_ascii=False),
-            encoding="utf-8"
-        )
+        # orjson serializes at C speed and emits UTF-8 bytes directly,
+        # skipping the stdlib's Python-level encoder and the re-encode
+        # that write_text would do
+        Path(output_path).write_bytes(orjson.dumps(result, option=orjson.OPT_INDENT_2))
     
     logger.info("Ingestion complete — API: %s, Tools: %d, Parser: %s",
                 result['api_info'].get('title', 'Unknown'), len(result['tools']), result['parser'])
@@ -384,6 +700,35 @@ def ingest(
     return result
 
 
+def ingest_many(
+    sources: list[str],
+    use_gemini: bool = False,
+    max_workers: int = 8,
+    use_cache: bool = True,
+    fast: bool = False,
+) -> list[dict[str, Any] | None]:
+    """Ingest several sources concurrently.
+
+    Every stage of ingest blocks on the network or inside C parser
+    code, so a thread pool overlaps the fetches and Gemini calls;
+    workers share the module-level HTTP client's connection pool. A
+    failed source is logged and leaves a None slot (result order
+    follows input order), so one bad spec doesn't sink the batch.
+    """
+    def _one(source: str) -> dict[str, Any] | None:
+        try:
+            return ingest(source, use_gemini=use_gemini, use_cache=use_cache, fast=fast)
+        except Exception as e:
+            logger.error("Ingestion failed for %s: %s", source, e)
+            return None
+
+    if len(sources) <= 1:
+        return [_one(s) for s in sources]
+    # No point spawning more threads than sources for small batches
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(sources))) as pool:
+        return list(pool.map(_one, sources))
+
+
 def main():
     """CLI entry point."""
     parser = argparse.ArgumentParser(
@@ -399,7 +744,11 @@ def main():
         "--file",
         help="Local file path to API spec",
     )
-    
+    source_group.add_argument(
+        "--batch",
+        help="File with one URL/path per line; sources are ingested concurrently",
+    )
+
     parser.add_argument(
         "--use-gemini",
         action="store_true",
@@ -409,16 +758,54 @@ def main():
         "--output", "-o",
         help="Output file path (default: test_application/raw_tool_definitions.json)",
     )
-    
+    parser.add_argument(
+        "--fast",
+        action="store_true",
+        help="Skip spec validation and only resolve $refs (trusted sources)",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Skip the on-disk tools cache and re-parse even for unchanged content",
+    )
+
     args = parser.parse_args()
-    
+
+    if args.batch:
+        sources = [
+            line.strip()
+            for line in Path(args.batch).read_text(encoding="utf-8").splitlines()
+            if line.strip() and not line.startswith("#")
+        ]
+        if not sources:
+            print(f"[ERROR] No sources found in {args.batch}")
+            sys.exit(1)
+        results = ingest_many(
+            sources,
+            use_gemini=args.use_gemini,
+            use_cache=not args.no_cache,
+            fast=args.fast,
+        )
+        if args.output:
+            logger.info("Writing batch output to: %s", args.output)
+            Path(args.output).write_bytes(
+                orjson.dumps(results, option=orjson.OPT_INDENT_2)
+            )
+        if any(r is None for r in results):
+            failed = [s for s, r in zip(sources, results) if r is None]
+            print(f"[ERROR] Ingestion failed for: {', '.join(failed)}")
+            sys.exit(1)
+        return
+
     source = args.url or args.file
-    
+
     try:
         ingest(
             source=source,
             use_gemini=args.use_gemini,
             output_path=args.output,
+            use_cache=not args.no_cache,
+            fast=args.fast,
         )
     except Exception as e:
         print(f"[ERROR] Ingestion failed: {e}")
@@ -31,20 +31,38 @@ _AUTH_ERROR_PATTERNS = re.compile(
 )
 
 
+# Characters that pass through into an env var prefix unchanged
+_ENV_CHARS = frozenset("ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789")
+
+
 def _derive_env_prefix(server_slug: str) -> str:
     """Derive likely env var prefix from server slug (e.g. user/petstore-mcp → PETSTORE_MCP)."""
-    name = server_slug.split("/")[-1] if "/" in server_slug else server_slug
-    return re.sub(r"[^A-Z0-9]+", "_", name.upper()).strip("_")
+    name = server_slug.rsplit("/", 1)[-1].upper()
+    # Runs of non-alphanumerics collapse to one "_", none at the ends —
+    # a split-and-join over a set-membership scan, no regex machinery
+    parts = []
+    run: list[str] = []
+    for ch in name:
+        if ch in _ENV_CHARS:
+            run.append(ch)
+        elif run:
+            parts.append("".join(run))
+            run = []
+    if run:
+        parts.append("".join(run))
+    return "_".join(parts)
 
 
 def _check_auth_errors(mcp_results: list) -> list[str]:
     """Check MCP tool results for auth-related errors. Returns list of error messages."""
     errors = []
+    search = _AUTH_ERROR_PATTERNS.search
     for r in mcp_results:
-        result_str = str(r.result) if r.result else ""
-        if r.is_error or _AUTH_ERROR_PATTERNS.search(result_str):
-            if _AUTH_ERROR_PATTERNS.search(result_str):
-                errors.append(f"{r.tool_name}: {result_str}")
+        # Auth messages sit at the start of a response, so scanning the
+        # first 4KB is enough — tool payloads can be megabytes
+        result_str = (str(r.result) if r.result else "")[:4096]
+        if search(result_str):
+            errors.append(f"{r.tool_name}: {result_str}")
     return errors
 
 